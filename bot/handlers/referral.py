@@ -1,6 +1,7 @@
 """Referral program handlers."""
 
 import io
+import functools
 import logging
 import qrcode
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
@@ -12,6 +13,26 @@ from bot.conversations.states import ConversationState
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=512)
+def _referral_qr_png(referral_link: str) -> bytes:
+    """Render a referral link QR code as PNG bytes, cached per link."""
+    qr = qrcode.QRCode(
+        version=1,
+        error_correction=qrcode.constants.ERROR_CORRECT_L,
+        box_size=10,
+        border=4,
+    )
+    qr.add_data(referral_link)
+    qr.make(fit=True)
+
+    # Create an image from the QR code
+    img = qr.make_image(fill_color="black", back_color="white")
+
+    bio = io.BytesIO()
+    img.save(bio, 'PNG')
+    return bio.getvalue()
+
+
 async def show_referral_menu(
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,
@@ -224,24 +245,9 @@ async def handle_create_qr(
     bot_username = context.bot.username
     referral_link = await referral_service.get_referral_link(user_id, bot_username)
 
-    # Generate QR code
-    qr = qrcode.QRCode(
-        version=1,
-        error_correction=qrcode.constants.ERROR_CORRECT_L,
-        box_size=10,
-        border=4,
-    )
-    qr.add_data(referral_link)
-    qr.make(fit=True)
-
-    # Create an image from the QR code
-    img = qr.make_image(fill_color="black", back_color="white")
-
-    # Save to bytes buffer
-    bio = io.BytesIO()
+    # Generate QR code (referral links are stable, so this is cached)
+    bio = io.BytesIO(_referral_qr_png(referral_link))
     bio.name = 'referral_qr.png'
-    img.save(bio, 'PNG')
-    bio.seek(0)
 
     # Send the QR code image
     caption = (
@@ -863,7 +863,7 @@ async def confirm_sell(
                 referral_link = await referral_service.get_referral_link(db_user.id, bot_username)
 
                 # Generate trade card image
-                image_buffer = generate_trade_card(
+                image_buffer = await generate_trade_card(
                     market_question=sell_position.get('market_question', 'Unknown Market'),
                     outcome=sell_position['outcome'],
                     entry_price=entry_price,
@@ -1014,7 +1014,7 @@ async def handle_share_trade(
 
     try:
         # Generate trade card image
-        image_buffer = generate_trade_card(
+        image_buffer = await generate_trade_card(
             market_question=last_trade["market_question"],
             outcome=last_trade["outcome"],
             entry_price=last_trade["entry_price"],
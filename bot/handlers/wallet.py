@@ -291,9 +291,9 @@ async def confirm_withdraw(
             raise Exception("Wallet not found")
 
         # Execute sponsored withdrawal (gas sponsor pays fees)
-        from core.blockchain import WithdrawalManager
+        from core.blockchain import get_withdrawal_manager
 
-        withdrawal_mgr = WithdrawalManager()
+        withdrawal_mgr = get_withdrawal_manager()
 
         # First attempt withdrawal
         result = await withdrawal_mgr.withdraw_sponsored(
@@ -6,6 +6,7 @@ USDC_E_ADDRESS = "0x2791Bca1f2de4661ED88A30C99A7a9449Aa84174"  # Bridged USDC.e
 
 # USDC has 6 decimals
 USDC_DECIMALS = 6
+USDC_SCALE = 10 ** USDC_DECIMALS  # Base units per 1 USDC
 
 # Minimum deposit amount (in USDC)
 MIN_DEPOSIT = 1.0
@@ -45,6 +46,9 @@ CLOB_CONTRACTS = {
     "NegRisk Exchange": "0xd91E80cF2E7be2e162c6513ceD06f1dD0dA35296",
 }
 
+# Multicall3 aggregator (same address on every EVM chain)
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
 # Polymarket CTF (Conditional Token Framework) contract - for position token approvals
 CTF_CONTRACT = "0x4D97DCd97eC945f40cF65F87097ACe5EA0476045"
 
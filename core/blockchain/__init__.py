@@ -1,4 +1,11 @@
 from .deposit_monitor import DepositMonitor
-from .withdrawals import WithdrawalManager
+from .nonce import NonceTracker, get_nonce_tracker
+from .withdrawals import WithdrawalManager, get_withdrawal_manager
 
-__all__ = ["DepositMonitor", "WithdrawalManager"]
+__all__ = [
+    "DepositMonitor",
+    "NonceTracker",
+    "get_nonce_tracker",
+    "WithdrawalManager",
+    "get_withdrawal_manager",
+]
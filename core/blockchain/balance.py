@@ -6,7 +6,7 @@ from typing import Optional
 from web3 import Web3
 
 from config import settings
-from config.constants import USDC_E_ADDRESS, USDC_DECIMALS
+from config.constants import USDC_E_ADDRESS, USDC_SCALE
 
 logger = logging.getLogger(__name__)
 
@@ -57,7 +57,7 @@ class BalanceService:
             ).call()
 
             # Convert from smallest unit to USDC
-            balance = balance_raw / (10 ** USDC_DECIMALS)
+            balance = balance_raw / USDC_SCALE
 
             logger.debug(f"Balance for {address[:10]}...: ${balance:.2f} USDC.e")
             return balance
@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from web3 import Web3
 
 from config import settings
-from config.constants import USDC_ADDRESS, USDC_E_ADDRESS, USDC_DECIMALS
+from config.constants import USDC_ADDRESS, USDC_E_ADDRESS, USDC_SCALE
 
 logger = logging.getLogger(__name__)
 
@@ -93,11 +93,8 @@ class DepositMonitor:
 
         deposits = []
 
-        # Normalize addresses
-        addresses_set = {
-            Web3.to_checksum_address(addr.lower())
-            for addr in wallet_addresses
-        }
+        # Normalize addresses (lowercase match needs no checksum keccak per wallet)
+        addresses_set = {addr.lower() for addr in wallet_addresses}
 
         # Check both USDC contracts
         for contract, token_addr in [
@@ -112,11 +109,12 @@ class DepositMonitor:
                 )
 
                 for event in events:
-                    to_addr = Web3.to_checksum_address(event.args.to)
+                    # Decoded log addresses are already checksummed
+                    to_addr = event.args.to
 
                     # Check if this transfer is to one of our wallets
-                    if to_addr in addresses_set:
-                        amount = event.args.value / (10 ** USDC_DECIMALS)
+                    if to_addr.lower() in addresses_set:
+                        amount = event.args.value / USDC_SCALE
 
                         deposits.append(DepositEvent(
                             from_address=event.args["from"],
@@ -154,7 +152,7 @@ class DepositMonitor:
             try:
                 # balanceOf function
                 balance = contract.functions.balanceOf(checksum_addr).call()
-                total += balance / (10 ** USDC_DECIMALS)
+                total += balance / USDC_SCALE
             except Exception as e:
                 logger.error(f"Error getting balance: {e}")
                 continue
@@ -0,0 +1,130 @@
+"""Local nonce tracking shared by everything that signs with our keys."""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from web3 import Web3
+
+logger = logging.getLogger(__name__)
+
+# How long a locally tracked nonce is trusted before refetching the pending
+# count from chain (bounds drift if an account also transacts elsewhere)
+NONCE_CACHE_TTL = 10.0
+
+# Maximum number of sender accounts tracked at once (least recently used
+# entries are dropped and simply refetched when needed again)
+NONCE_CACHE_SIZE = 1024
+
+
+class NonceTracker:
+    """Hand out sequential nonces per sender without an RPC per transaction."""
+
+    def __init__(
+        self,
+        ttl: float = NONCE_CACHE_TTL,
+        max_entries: int = NONCE_CACHE_SIZE,
+    ):
+        """
+        Initialize nonce tracker.
+
+        Args:
+            ttl: Seconds a fetched nonce is trusted before refetching
+            max_entries: Maximum number of sender addresses to track
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+        # address -> (fetched_at, next nonce), in least recently used order
+        self._entries: OrderedDict[str, tuple[float, int]] = OrderedDict()
+        self._lock = asyncio.Lock()
+
+    async def reserve(self, w3: Web3, address: str) -> int:
+        """
+        Reserve the next nonce for address, refetching only when stale.
+
+        Args:
+            w3: Web3 instance used to fetch the pending count
+            address: Checksummed sender address
+
+        Returns:
+            Nonce to use for the next transaction
+        """
+        async with self._lock:
+            now = time.monotonic()
+            entry = self._entries.get(address)
+            if entry and now - entry[0] < self.ttl:
+                fetched_at, nonce = entry
+            else:
+                fetched_at = now
+                nonce = w3.eth.get_transaction_count(address, "pending")
+
+            self._entries[address] = (fetched_at, nonce + 1)
+            self._entries.move_to_end(address)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return nonce
+
+    def release(self, address: str, nonce: int) -> None:
+        """
+        Give back a reserved nonce whose tx was never signed.
+
+        Rolls the counter back if nothing was reserved after it, otherwise
+        drops the entry so the next reservation refetches from chain.
+        """
+        entry = self._entries.get(address)
+        if entry and entry[1] == nonce + 1:
+            self._entries[address] = (entry[0], nonce)
+        else:
+            self._entries.pop(address, None)
+
+    def evict(self, address: str) -> None:
+        """Forget address so its next reservation refetches from chain."""
+        self._entries.pop(address, None)
+
+    async def sign_and_send(self, w3: Web3, account, tx: dict):
+        """
+        Reserve a nonce for account, sign tx with it and broadcast.
+
+        The nonce is reserved only once every other field of tx is known, so
+        fee and gas lookups can't strand it, and is given back if the tx
+        fails before reaching the network.
+
+        Args:
+            w3: Web3 instance used for the nonce lookup and broadcast
+            account: Local account that signs and sends tx
+            tx: Transaction fields, without nonce
+
+        Returns:
+            Transaction hash
+        """
+        address = account.address
+        nonce = await self.reserve(w3, address)
+        try:
+            signed_tx = account.sign_transaction({**tx, "nonce": nonce})
+        except Exception:
+            self.release(address, nonce)
+            raise
+
+        try:
+            return w3.eth.send_raw_transaction(signed_tx.raw_transaction)
+        except Exception:
+            # Nonce wasn't consumed or our view is stale - refetch next time
+            self.evict(address)
+            raise
+
+
+# Shared tracker (lazy-initialized): WithdrawalManager and CommissionService
+# sign with the same gas sponsor and user keys, so they must draw nonces
+# from one place
+_nonce_tracker: Optional[NonceTracker] = None
+
+
+def get_nonce_tracker() -> NonceTracker:
+    """Get or create the shared NonceTracker instance."""
+    global _nonce_tracker
+    if _nonce_tracker is None:
+        _nonce_tracker = NonceTracker()
+    return _nonce_tracker
@@ -1,68 +1,116 @@
 """USDC withdrawal management."""
 
+import asyncio
+import functools
 import logging
+import time
 from typing import Optional
 from dataclasses import dataclass
 
 from web3 import Web3
+from eth_abi import decode as abi_decode, encode as abi_encode
 from eth_account import Account
+from eth_utils import (
+    function_signature_to_4byte_selector,
+    is_checksum_address,
+    is_hex_address,
+)
 
 from config import settings
-from config.constants import USDC_E_ADDRESS, USDC_DECIMALS, MIN_WITHDRAWAL, MAX_WITHDRAWAL
+from config.constants import (
+    USDC_E_ADDRESS,
+    USDC_SCALE,
+    MIN_WITHDRAWAL,
+    MAX_WITHDRAWAL,
+    MULTICALL3_ADDRESS,
+)
+from core.blockchain.nonce import get_nonce_tracker
 
 logger = logging.getLogger(__name__)
 
-# ERC20 ABI with transfer, transferFrom, approve, and balanceOf
-ERC20_ABI = [
-    {
-        "constant": False,
-        "inputs": [
-            {"name": "_to", "type": "address"},
-            {"name": "_value", "type": "uint256"},
-        ],
-        "name": "transfer",
-        "outputs": [{"name": "", "type": "bool"}],
-        "type": "function",
-    },
-    {
-        "constant": False,
-        "inputs": [
-            {"name": "_from", "type": "address"},
-            {"name": "_to", "type": "address"},
-            {"name": "_value", "type": "uint256"},
-        ],
-        "name": "transferFrom",
-        "outputs": [{"name": "", "type": "bool"}],
-        "type": "function",
-    },
-    {
-        "constant": False,
-        "inputs": [
-            {"name": "_spender", "type": "address"},
-            {"name": "_value", "type": "uint256"},
-        ],
-        "name": "approve",
-        "outputs": [{"name": "", "type": "bool"}],
-        "type": "function",
-    },
-    {
-        "constant": True,
-        "inputs": [{"name": "_owner", "type": "address"}],
-        "name": "balanceOf",
-        "outputs": [{"name": "balance", "type": "uint256"}],
-        "type": "function",
-    },
-    {
-        "constant": True,
-        "inputs": [
-            {"name": "_owner", "type": "address"},
-            {"name": "_spender", "type": "address"},
-        ],
-        "name": "allowance",
-        "outputs": [{"name": "remaining", "type": "uint256"}],
-        "type": "function",
-    },
-]
+# How long fee estimates from eth_feeHistory are reused (Polygon blocks are ~2s)
+FEE_CACHE_TTL = 5.0
+
+# Polygon validators reject tips below 30 gwei
+MIN_PRIORITY_FEE = Web3.to_wei(30, "gwei")
+
+# Fixed gas limits for USDC.e calls (observed ~45-65k, with headroom)
+USDC_TRANSFER_GAS = 80_000
+USDC_TRANSFER_FROM_GAS = 100_000
+
+# Multiple of the required gas cost sent when sponsoring a user's POL
+GAS_SPONSOR_HEADROOM = 1.5
+
+
+@functools.lru_cache(maxsize=4096)
+def to_checksum(address: str) -> str:
+    """EIP-55 checksum an address (keccak256 per call, so memoized)."""
+    return Web3.to_checksum_address(address)
+
+
+def _is_valid_address(address: str) -> bool:
+    """
+    Validate an address offline, same rules as Web3.is_address.
+
+    Malformed input fails the cheap hex/length check before any keccak
+    hashing; mixed-case input must carry a valid EIP-55 checksum.
+    """
+    if not isinstance(address, str) or not is_hex_address(address):
+        return False
+    body = address[2:] if address[:2].lower() == "0x" else address
+    if body.islower() or body.isupper():
+        return True
+    return is_checksum_address(address)
+
+
+# USDC.e calls have fixed argument shapes, so calldata is encoded by hand
+# instead of going through the contract ABI codec
+BALANCE_OF_SELECTOR = function_signature_to_4byte_selector("balanceOf(address)")
+ALLOWANCE_SELECTOR = function_signature_to_4byte_selector("allowance(address,address)")
+AGGREGATE_SELECTOR = function_signature_to_4byte_selector("aggregate((address,bytes)[])")
+TRANSFER_SELECTOR = function_signature_to_4byte_selector("transfer(address,uint256)")
+TRANSFER_FROM_SELECTOR = function_signature_to_4byte_selector("transferFrom(address,address,uint256)")
+APPROVE_SELECTOR = function_signature_to_4byte_selector("approve(address,uint256)")
+
+
+def _encode_address(address: str) -> bytes:
+    """ABI-encode a 0x-prefixed address as a 32-byte word."""
+    return int(address, 16).to_bytes(32, "big")
+
+
+def _encode_uint(value: int) -> bytes:
+    """ABI-encode a uint256 as a 32-byte word."""
+    return value.to_bytes(32, "big")
+
+
+def _balance_of_data(owner: str) -> bytes:
+    """Calldata for balanceOf(owner)."""
+    return BALANCE_OF_SELECTOR + _encode_address(owner)
+
+
+def _allowance_data(owner: str, spender: str) -> bytes:
+    """Calldata for allowance(owner, spender)."""
+    return ALLOWANCE_SELECTOR + _encode_address(owner) + _encode_address(spender)
+
+
+def _transfer_data(to: str, amount: int) -> bytes:
+    """Calldata for transfer(to, amount)."""
+    return TRANSFER_SELECTOR + _encode_address(to) + _encode_uint(amount)
+
+
+def _transfer_from_data(owner: str, to: str, amount: int) -> bytes:
+    """Calldata for transferFrom(owner, to, amount)."""
+    return TRANSFER_FROM_SELECTOR + _encode_address(owner) + _encode_address(to) + _encode_uint(amount)
+
+
+def _approve_data(spender: str, amount: int) -> bytes:
+    """Calldata for approve(spender, amount)."""
+    return APPROVE_SELECTOR + _encode_address(spender) + _encode_uint(amount)
+
+
+def _decode_uint(raw: bytes) -> int:
+    """Decode a single uint256 return value."""
+    return int.from_bytes(raw[-32:], "big")
 
 
 @dataclass
@@ -94,17 +142,88 @@ class WithdrawalManager:
         self.w3 = Web3(Web3.HTTPProvider(self.rpc_url))
 
         # USDC.e contract (Polymarket uses bridged USDC.e)
-        self.usdc_contract = self.w3.eth.contract(
-            address=Web3.to_checksum_address(USDC_E_ADDRESS),
-            abi=ERC20_ABI,
-        )
+        self.usdc_address = Web3.to_checksum_address(USDC_E_ADDRESS)
 
-        # Gas sponsor account
+        # Gas sponsor account (reused for signing so the key is parsed once)
         if self.gas_sponsor_key:
             self.gas_sponsor_account = Account.from_key(self.gas_sponsor_key)
         else:
             self.gas_sponsor_account = None
 
+        # (fetched_at, fee fields) - shared by all txs built by this manager
+        self._fee_cache: tuple[float, dict] = (0.0, {})
+
+        # Nonces are shared with every other service signing with these keys
+        self._nonces = get_nonce_tracker()
+
+    async def _fee_params(self) -> dict:
+        """
+        Get EIP-1559 fee fields, derived locally from a cached eth_feeHistory.
+
+        Returns:
+            Dict with type, maxFeePerGas and maxPriorityFeePerGas (wei)
+        """
+        now = time.monotonic()
+        fetched_at, fees = self._fee_cache
+        if fees and now - fetched_at < FEE_CACHE_TTL:
+            return fees
+
+        history = self.w3.eth.fee_history(5, "latest", [50])
+
+        # Last entry is the base fee of the next (pending) block
+        base_fee = history["baseFeePerGas"][-1]
+        tips = sorted(reward[0] for reward in history["reward"])
+        priority_fee = max(tips[len(tips) // 2], MIN_PRIORITY_FEE)
+
+        fees = {
+            "type": 2,
+            # 2x base fee survives several full blocks of base fee increases
+            "maxFeePerGas": 2 * base_fee + priority_fee,
+            "maxPriorityFeePerGas": priority_fee,
+        }
+        self._fee_cache = (now, fees)
+        return fees
+
+    def _usdc_balance(self, address: str) -> int:
+        """Get USDC.e balance in base units via a raw balanceOf eth_call."""
+        raw = self.w3.eth.call({
+            "to": self.usdc_address,
+            "data": _balance_of_data(address),
+        })
+        return _decode_uint(raw)
+
+    def _usdc_allowance(self, owner: str, spender: str) -> int:
+        """Get USDC.e allowance in base units via a raw allowance eth_call."""
+        raw = self.w3.eth.call({
+            "to": self.usdc_address,
+            "data": _allowance_data(owner, spender),
+        })
+        return _decode_uint(raw)
+
+    def _multicall(self, calls: list[tuple[str, bytes]]) -> list[bytes]:
+        """
+        Execute several read-only calls in one eth_call via Multicall3.
+
+        Args:
+            calls: (target address, calldata) pairs
+
+        Returns:
+            Raw return data for each call, in order
+        """
+        data = AGGREGATE_SELECTOR + abi_encode(["(address,bytes)[]"], [calls])
+        raw = self.w3.eth.call({"to": MULTICALL3_ADDRESS, "data": data})
+        _, results = abi_decode(["uint256", "bytes[]"], raw)
+        return list(results)
+
+    def _usdc_balance_and_allowance(self, owner: str, spender: str) -> tuple[int, int]:
+        """Get USDC.e balance and allowance of owner in a single RPC."""
+        usdc = self.usdc_address
+        balance_raw, allowance_raw = self._multicall([
+            (usdc, _balance_of_data(owner)),
+            (usdc, _allowance_data(owner, spender)),
+        ])
+        return _decode_uint(balance_raw), _decode_uint(allowance_raw)
+
     async def withdraw(
         self,
         from_private_key: str,
@@ -140,7 +259,7 @@ class WithdrawalManager:
                 )
 
             # Validate destination address
-            if not Web3.is_address(to_address):
+            if not _is_valid_address(to_address):
                 return WithdrawalResult(
                     success=False,
                     error="Invalid destination address",
@@ -151,8 +270,8 @@ class WithdrawalManager:
             sender_address = sender_account.address
 
             # Check USDC balance
-            balance = self.usdc_contract.functions.balanceOf(sender_address).call()
-            balance_usdc = balance / (10 ** USDC_DECIMALS)
+            balance = self._usdc_balance(sender_address)
+            balance_usdc = balance / USDC_SCALE
 
             if balance_usdc < amount:
                 return WithdrawalResult(
@@ -160,15 +279,29 @@ class WithdrawalManager:
                     error=f"Insufficient balance: ${balance_usdc:.2f} < ${amount:.2f}",
                 )
 
+            # Convert amount to token units
+            amount_units = int(amount * USDC_SCALE)
+
+            # USDC.e transfer gas is well known, so skip the estimate_gas RPC
+            transfer_data = _transfer_data(to_checksum(to_address), amount_units)
+            gas_limit = USDC_TRANSFER_GAS
+            fees = await self._fee_params()
+            required_wei = gas_limit * fees["maxFeePerGas"]
+
             # Check if user has POL for gas, if not sponsor it
-            user_pol_balance = self.w3.eth.get_balance(sender_address) / 1e18
-            required_pol = 0.02  # Estimate ~0.02 POL needed for withdrawal gas
+            user_pol_wei = self.w3.eth.get_balance(sender_address)
 
-            if user_pol_balance < required_pol:
-                logger.info(f"User has insufficient POL ({user_pol_balance:.4f}), sponsoring gas")
+            if user_pol_wei < required_wei:
+                logger.info(
+                    f"User has insufficient POL ({user_pol_wei / 1e18:.4f} < "
+                    f"{required_wei / 1e18:.4f}), sponsoring gas"
+                )
                 if self.gas_sponsor_account:
-                    # Sponsor gas for the user
-                    sponsor_result = await self.sponsor_gas(sender_address, required_pol)
+                    # Sponsor with headroom in case fees move before we send
+                    sponsor_pol = self.w3.from_wei(
+                        int(required_wei * GAS_SPONSOR_HEADROOM), "ether"
+                    )
+                    sponsor_result = await self.sponsor_gas(sender_address, sponsor_pol)
                     if not sponsor_result.success:
                         return WithdrawalResult(
                             success=False,
@@ -177,17 +310,10 @@ class WithdrawalManager:
                     logger.info(f"Gas sponsored successfully: {sponsor_result.tx_hash}")
 
                     # Wait for gas transfer to be mined (up to 60 seconds)
-                    import asyncio
-                    for i in range(30):  # 30 attempts * 2 seconds = 60 seconds max
-                        await asyncio.sleep(2)
-                        try:
-                            receipt = self.w3.eth.get_transaction_receipt(sponsor_result.tx_hash)
-                            if receipt and receipt.status == 1:
-                                logger.info(f"Gas transfer confirmed in block {receipt.blockNumber}")
-                                break
-                        except Exception:
-                            pass  # Transaction not yet mined
-                    else:
+                    confirmed = await self.wait_for_transaction(
+                        sponsor_result.tx_hash, timeout=60
+                    )
+                    if not confirmed:
                         logger.warning("Gas transfer taking longer than expected, proceeding anyway")
 
                     # Verify user now has POL
@@ -199,35 +325,19 @@ class WithdrawalManager:
                         error="Insufficient POL for gas and no gas sponsor configured",
                     )
 
-            # Convert amount to token units
-            amount_units = int(amount * (10 ** USDC_DECIMALS))
-
-            # Build transaction
-            nonce = self.w3.eth.get_transaction_count(sender_address)
-            gas_price = self.w3.eth.gas_price
-
-            # Estimate gas
-            tx_data = self.usdc_contract.functions.transfer(
-                Web3.to_checksum_address(to_address),
-                amount_units,
-            )
-
-            estimated_gas = tx_data.estimate_gas({"from": sender_address})
-
             # Build the transaction
-            tx = tx_data.build_transaction({
+            tx = {
                 "from": sender_address,
-                "nonce": nonce,
-                "gas": int(estimated_gas * 1.2),  # Add 20% buffer
-                "gasPrice": gas_price,
+                "to": self.usdc_address,
+                "data": transfer_data,
+                "value": 0,
+                "gas": gas_limit,
+                **fees,
                 "chainId": settings.chain_id,
-            })
-
-            # Sign transaction
-            signed_tx = self.w3.eth.account.sign_transaction(tx, from_private_key)
+            }
 
-            # Send transaction
-            tx_hash = self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
+            # Sign and send transaction
+            tx_hash = await self._nonces.sign_and_send(self.w3, sender_account, tx)
 
             logger.info(
                 f"Withdrawal sent: {amount} USDC from {sender_address[:10]}... "
@@ -275,24 +385,28 @@ class WithdrawalManager:
         self,
         tx_hash: str,
         timeout: int = 60,
-        poll_interval: float = 2.0,
+        poll_interval: float = 0.5,
+        max_poll_interval: float = 4.0,
     ) -> bool:
         """
         Wait for a transaction to be confirmed on-chain.
 
+        Polls quickly at first (most txs land in the next block) and backs
+        off exponentially up to max_poll_interval to limit RPC load.
+
         Args:
             tx_hash: Transaction hash to wait for
             timeout: Maximum time to wait in seconds
-            poll_interval: Time between checks in seconds
+            poll_interval: Initial time between checks in seconds
+            max_poll_interval: Upper bound for the backoff delay in seconds
 
         Returns:
             True if confirmed, False if timeout or failed
         """
-        import asyncio
-
-        attempts = int(timeout / poll_interval)
+        deadline = time.monotonic() + timeout
+        delay = poll_interval
 
-        for i in range(attempts):
+        while True:
             try:
                 receipt = self.w3.eth.get_transaction_receipt(tx_hash)
                 if receipt:
@@ -305,7 +419,12 @@ class WithdrawalManager:
             except Exception:
                 pass  # Transaction not yet mined
 
-            await asyncio.sleep(poll_interval)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 1.5, max_poll_interval)
 
         logger.warning(f"Transaction {tx_hash[:16]}... timed out after {timeout}s")
         return False
@@ -321,9 +440,7 @@ class WithdrawalManager:
             Balance in POL
         """
         try:
-            balance_wei = self.w3.eth.get_balance(
-                Web3.to_checksum_address(address)
-            )
+            balance_wei = self.w3.eth.get_balance(to_checksum(address))
             return self.w3.from_wei(balance_wei, "ether")
         except Exception as e:
             logger.error(f"Failed to get gas balance: {e}")
@@ -351,26 +468,18 @@ class WithdrawalManager:
             )
 
         try:
-            sponsor_address = self.gas_sponsor_account.address
-            nonce = self.w3.eth.get_transaction_count(sponsor_address)
-            gas_price = self.w3.eth.gas_price
+            fees = await self._fee_params()
 
             tx = {
-                "from": sponsor_address,
-                "to": Web3.to_checksum_address(to_address),
+                "from": self.gas_sponsor_account.address,
+                "to": to_checksum(to_address),
                 "value": self.w3.to_wei(amount_pol, "ether"),
-                "nonce": nonce,
                 "gas": 21000,
-                "gasPrice": gas_price,
+                **fees,
                 "chainId": settings.chain_id,
             }
 
-            signed_tx = self.w3.eth.account.sign_transaction(
-                tx,
-                self.gas_sponsor_key,
-            )
-
-            tx_hash = self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
+            tx_hash = await self._nonces.sign_and_send(self.w3, self.gas_sponsor_account, tx)
 
             logger.info(f"Gas sponsored: {amount_pol} POL to {to_address[:10]}...")
 
@@ -402,8 +511,6 @@ class WithdrawalManager:
         Returns:
             WithdrawalResult with tx hash or error
         """
-        import asyncio
-
         if not self.gas_sponsor_account:
             return WithdrawalResult(
                 success=False,
@@ -419,10 +526,7 @@ class WithdrawalManager:
         for attempt in range(max_retries + 1):
             try:
                 # Check if already approved
-                current_allowance = self.usdc_contract.functions.allowance(
-                    Web3.to_checksum_address(user_address),
-                    Web3.to_checksum_address(sponsor_address),
-                ).call()
+                current_allowance = self._usdc_allowance(user_address, sponsor_address)
 
                 # Approve unlimited USDC (max uint256)
                 max_uint256 = 2**256 - 1
@@ -435,20 +539,18 @@ class WithdrawalManager:
                     )
 
                 # Build approval transaction
-                approve_tx = self.usdc_contract.functions.approve(
-                    Web3.to_checksum_address(sponsor_address),
-                    max_uint256,
-                ).build_transaction({
+                approve_tx = {
                     "from": user_address,
-                    "nonce": self.w3.eth.get_transaction_count(user_address),
+                    "to": self.usdc_address,
+                    "data": _approve_data(sponsor_address, max_uint256),
+                    "value": 0,
                     "gas": 100000,
-                    "gasPrice": self.w3.eth.gas_price,
+                    **await self._fee_params(),
                     "chainId": settings.chain_id,
-                })
+                }
 
-                # User signs the approval
-                signed_tx = self.w3.eth.account.sign_transaction(approve_tx, user_private_key)
-                tx_hash = self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
+                # User signs and sends the approval
+                tx_hash = await self._nonces.sign_and_send(self.w3, user_account, approve_tx)
 
                 logger.info(f"USDC approval sent: {tx_hash.hex()}")
 
@@ -501,8 +603,6 @@ class WithdrawalManager:
         Returns:
             WithdrawalResult with tx hash or error
         """
-        import asyncio
-
         if not self.gas_sponsor_account:
             return WithdrawalResult(
                 success=False,
@@ -523,23 +623,26 @@ class WithdrawalManager:
             )
 
         # Validate destination address
-        if not Web3.is_address(to_address):
+        if not _is_valid_address(to_address):
             return WithdrawalResult(
                 success=False,
                 error="Invalid destination address",
             )
 
+        # Checksum once; Account.address is already checksummed
         sponsor_address = self.gas_sponsor_account.address
-        amount_units = int(amount * (10 ** USDC_DECIMALS))
+        user_cs = to_checksum(user_address)
+        to_cs = to_checksum(to_address)
+        amount_units = int(amount * USDC_SCALE)
         last_error = None
 
         for attempt in range(max_retries + 1):
             try:
-                # Check user USDC balance
-                balance = self.usdc_contract.functions.balanceOf(
-                    Web3.to_checksum_address(user_address)
-                ).call()
-                balance_usdc = balance / (10 ** USDC_DECIMALS)
+                # Check user USDC balance and allowance in one call
+                balance, allowance = self._usdc_balance_and_allowance(
+                    user_cs, sponsor_address
+                )
+                balance_usdc = balance / USDC_SCALE
 
                 if balance_usdc < amount:
                     return WithdrawalResult(
@@ -547,12 +650,6 @@ class WithdrawalManager:
                         error=f"Insufficient balance: ${balance_usdc:.2f} < ${amount:.2f}",
                     )
 
-                # Check allowance
-                allowance = self.usdc_contract.functions.allowance(
-                    Web3.to_checksum_address(user_address),
-                    Web3.to_checksum_address(sponsor_address),
-                ).call()
-
                 if allowance < amount_units:
                     return WithdrawalResult(
                         success=False,
@@ -560,28 +657,18 @@ class WithdrawalManager:
                     )
 
                 # Build transferFrom transaction (gas sponsor executes)
-                tx_data = self.usdc_contract.functions.transferFrom(
-                    Web3.to_checksum_address(user_address),
-                    Web3.to_checksum_address(to_address),
-                    amount_units,
-                )
-
-                # Estimate gas
-                estimated_gas = tx_data.estimate_gas({"from": sponsor_address})
-
-                # Build transaction
-                nonce = self.w3.eth.get_transaction_count(sponsor_address)
-                tx = tx_data.build_transaction({
+                tx = {
                     "from": sponsor_address,
-                    "nonce": nonce,
-                    "gas": int(estimated_gas * 1.2),  # 20% buffer
-                    "gasPrice": self.w3.eth.gas_price,
+                    "to": self.usdc_address,
+                    "data": _transfer_from_data(user_cs, to_cs, amount_units),
+                    "value": 0,
+                    "gas": USDC_TRANSFER_FROM_GAS,
+                    **await self._fee_params(),
                     "chainId": settings.chain_id,
-                })
+                }
 
                 # Gas sponsor signs and sends
-                signed_tx = self.w3.eth.account.sign_transaction(tx, self.gas_sponsor_key)
-                tx_hash = self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
+                tx_hash = await self._nonces.sign_and_send(self.w3, self.gas_sponsor_account, tx)
 
                 logger.info(
                     f"Sponsored withdrawal: {amount} USDC from {user_address[:10]}... "
@@ -642,3 +729,16 @@ class WithdrawalManager:
             to_address=to_address,
             amount=amount,
         )
+
+
+# Shared manager (lazy-initialized), so the Web3 provider and fee cache
+# survive across withdrawals
+_withdrawal_manager: Optional[WithdrawalManager] = None
+
+
+def get_withdrawal_manager() -> WithdrawalManager:
+    """Get or create the shared WithdrawalManager instance."""
+    global _withdrawal_manager
+    if _withdrawal_manager is None:
+        _withdrawal_manager = WithdrawalManager()
+    return _withdrawal_manager
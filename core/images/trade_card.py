@@ -1,12 +1,130 @@
 """Trade card image generator for sharing closed positions."""
 
 import io
+import asyncio
+import functools
 import qrcode
 import httpx
 from PIL import Image, ImageDraw, ImageFont
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Optional
 
+# DejaVu fonts shipped with the package so rendering doesn't depend on the host
+FONTS_DIR = Path(__file__).parent / "fonts"
+BUNDLED_FONT = str(FONTS_DIR / "DejaVuSans.ttf")
+BUNDLED_BOLD_FONT = str(FONTS_DIR / "DejaVuSans-Bold.ttf")
+
+
+@functools.lru_cache(maxsize=None)
+def _load_font(paths: tuple[str, ...], size: int) -> ImageFont.ImageFont:
+    """Load the first available font from paths, cached per (paths, size)."""
+    for path in paths:
+        try:
+            # Cards are Latin-only, so skip HarfBuzz/Raqm shaping
+            return ImageFont.truetype(
+                path, size, layout_engine=ImageFont.Layout.BASIC
+            )
+        except (OSError, IOError):
+            continue
+    return ImageFont.load_default()
+
+
+@functools.lru_cache(maxsize=256)
+def _text_mask(text: str, font: ImageFont.ImageFont) -> tuple[Image.Image, tuple[int, int]]:
+    """
+    Rasterize text once into a coverage mask, cached per (text, font).
+
+    Returns:
+        (L-mode mask cropped to the text, offset of the mask from the origin)
+    """
+    left, top, right, bottom = font.getbbox(text)
+    mask = Image.new('L', (right - left, bottom - top), 0)
+    ImageDraw.Draw(mask).text((-left, -top), text, font=font, fill=255)
+    return mask, (left, top)
+
+
+@functools.lru_cache(maxsize=None)
+def _glyph(char: str, font: ImageFont.ImageFont) -> tuple[Image.Image, tuple[int, int], float]:
+    """
+    Glyph atlas entry for a single character: (mask, offset, advance).
+
+    Used for the hero ROI number, which changes every card but only ever
+    uses a small set of characters.
+    """
+    mask, offset = _text_mask(char, font)
+    return mask, offset, font.getlength(char)
+
+
+@functools.lru_cache(maxsize=512)
+def _render_qr(link: str, size: int, back_color: tuple) -> Image.Image:
+    """
+    Render a referral QR code, cached per link.
+
+    Referral links are stable per user, so repeat cards skip the QR
+    encoding. Callers must treat the result as read-only.
+    """
+    # No quiet zone in the image: the footer around it is back_color already
+    qr = qrcode.QRCode(
+        version=1,
+        error_correction=qrcode.constants.ERROR_CORRECT_L,
+        box_size=1,
+        border=0,
+    )
+    qr.add_data(link)
+    qr.make(fit=True)
+
+    # Whole-pixel module size that lands closest to size (the code may come
+    # out a few pixels larger or smaller), so modules are never resampled
+    qr.box_size = max(1, round(size / qr.modules_count))
+    # Custom colors make qrcode render straight to RGB; unwrap, don't convert
+    return qr.make_image(fill_color="white", back_color=back_color).get_image()
+
+
+# Keep-alive client for market images (shared by worker threads)
+_http_client: Optional[httpx.Client] = None
+
+
+def _get_http_client() -> httpx.Client:
+    """Get or create the shared HTTP client for image downloads."""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.Client(timeout=10.0, follow_redirects=True)
+    return _http_client
+
+
+@functools.lru_cache(maxsize=None)
+def _corner_mask(size: int, radius: int) -> Image.Image:
+    """L mask of the area outside a rounded square (placeholder outline)."""
+    mask = Image.new('L', (size, size), 255)
+    ImageDraw.Draw(mask).rounded_rectangle(
+        [0, 0, size - 1, size - 1],
+        radius=radius,
+        fill=0
+    )
+    return mask
+
+
+@functools.lru_cache(maxsize=256)
+def _load_market_tile(url: str, size: int, radius: int, back_color: tuple) -> Image.Image:
+    """
+    Fetch a market image as a finished size x size tile with rounded corners.
+
+    The corners are composited onto back_color here, so each card does a
+    plain opaque paste instead of a masked alpha blend. Cached per URL
+    since many users trade the same markets; failures raise, so they are
+    not cached. Callers must treat the result as read-only.
+    """
+    response = _get_http_client().get(url)
+    response.raise_for_status()
+    market_img = Image.open(io.BytesIO(response.content)).convert('RGB')
+    market_img = market_img.resize((size, size), Image.Resampling.LANCZOS)
+
+    # Round the corners in place by filling them with the background
+    market_img.paste(back_color, (0, 0), _corner_mask(size, radius))
+    return market_img
+
 
 @dataclass
 class TradeCardData:
@@ -38,6 +156,23 @@ class TradeCardGenerator:
     TEXT_GRAY = (140, 140, 150)
     DIVIDER_COLOR = (60, 60, 70)
 
+    # (sign prefix, color) for the ROI number, indexed by "is profit"
+    ROI_STYLES = {True: ("+", PROFIT_COLOR), False: ("", LOSS_COLOR)}
+
+    # Palette size for PNG output of cards without a market photo
+    PALETTE_COLORS = 128
+
+    # Market image square (right side)
+    MARKET_IMG_SIZE = 280
+    MARKET_IMG_X = CARD_WIDTH - MARKET_IMG_SIZE - 80
+    MARKET_IMG_Y = 60
+    MARKET_IMG_RADIUS = 20
+
+    # Footer layout (QR code on the left, text next to it)
+    FOOTER_HEIGHT = 130
+    QR_X = 60
+    QR_SIZE = 90
+
     def __init__(self):
         self.brand_font = None
         self.tagline_font = None
@@ -48,10 +183,15 @@ class TradeCardGenerator:
         self.footer_font = None
         self._load_fonts()
 
+        # Static layer (branding, labels, footer text), copied for each card
+        self._position_label_width = 0
+        self._template = self._render_background()
+
     def _load_fonts(self):
-        """Load fonts for text rendering."""
-        # Try multiple font paths for cross-platform compatibility
-        font_paths = [
+        """Load fonts for text rendering (parsed once per process)."""
+        # Bundled fonts first, then system fonts as a fallback
+        font_paths = (
+            BUNDLED_FONT,
             # macOS
             "/System/Library/Fonts/Helvetica.ttc",
             "/System/Library/Fonts/SFNSDisplay.ttf",
@@ -59,41 +199,26 @@ class TradeCardGenerator:
             # Linux
             "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
             "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-        ]
+        )
 
-        bold_font_paths = [
+        bold_font_paths = (
+            BUNDLED_BOLD_FONT,
             "/System/Library/Fonts/Helvetica.ttc",
             "/Library/Fonts/Arial Bold.ttf",
             "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
-        ]
-
-        def load_font(paths, size):
-            for path in paths:
-                try:
-                    return ImageFont.truetype(path, size)
-                except (OSError, IOError):
-                    continue
-            return ImageFont.load_default()
-
-        self.brand_font = load_font(bold_font_paths, 42)
-        self.tagline_font = load_font(font_paths, 24)
-        self.label_font = load_font(font_paths, 28)
-        self.position_font = load_font(bold_font_paths, 36)
-        self.market_font = load_font(font_paths, 32)
-        self.percentage_font = load_font(bold_font_paths, 120)
-        self.footer_font = load_font(font_paths, 26)
-        self.footer_small_font = load_font(font_paths, 20)
-
-    def generate(self, data: TradeCardData) -> io.BytesIO:
-        """
-        Generate a trade card image matching the PolyBot design.
-
-        Args:
-            data: Trade card data
+        )
 
-        Returns:
-            BytesIO buffer containing PNG image
-        """
+        self.brand_font = _load_font(bold_font_paths, 42)
+        self.tagline_font = _load_font(font_paths, 24)
+        self.label_font = _load_font(font_paths, 28)
+        self.position_font = _load_font(bold_font_paths, 36)
+        self.market_font = _load_font(font_paths, 32)
+        self.percentage_font = _load_font(bold_font_paths, 120)
+        self.footer_font = _load_font(font_paths, 26)
+        self.footer_small_font = _load_font(font_paths, 20)
+
+    def _render_background(self) -> Image.Image:
+        """Render everything that is identical across cards."""
         img = Image.new('RGB', (self.CARD_WIDTH, self.CARD_HEIGHT), self.BG_COLOR)
         draw = ImageDraw.Draw(img)
 
@@ -121,30 +246,75 @@ class TradeCardGenerator:
             fill=self.TEXT_GRAY
         )
 
-        # === POSITION INFO ===
-        y_pos = 170
-
         # "POSITION:" label
         draw.text(
-            (60, y_pos),
+            (60, 170),
             "POSITION:",
             font=self.label_font,
             fill=self.TEXT_GRAY
         )
+        # Advance width is enough for layout; avoids a full bbox render
+        self._position_label_width = int(self.label_font.getlength("POSITION:"))
 
-        # Position/outcome name (bold, white)
-        label_bbox = draw.textbbox((0, 0), "POSITION:", font=self.label_font)
-        label_width = label_bbox[2] - label_bbox[0]
+        # "TOTAL RETURN" label
         draw.text(
-            (60 + label_width + 15, y_pos),
+            (60, 320),
+            "TOTAL RETURN",
+            font=self.label_font,
+            fill=self.TEXT_GRAY
+        )
+
+        # Market image placeholder (covered when the market has an image)
+        self._draw_market_placeholder(draw)
+
+        # Footer separator and text
+        self._draw_footer_static(draw)
+
+        return img
+
+    def generate(self, data: TradeCardData) -> io.BytesIO:
+        """
+        Generate a trade card image matching the PolyBot design.
+
+        Args:
+            data: Trade card data
+
+        Returns:
+            BytesIO buffer containing PNG image
+        """
+        # BytesIO shares the bytes object until written to, so no copy here
+        buffer = io.BytesIO(self.generate_bytes(data))
+        buffer.name = 'trade_card.png'
+        return buffer
+
+    def generate_bytes(self, data: TradeCardData) -> bytes:
+        """
+        Generate a trade card image as raw PNG bytes.
+
+        Args:
+            data: Trade card data
+
+        Returns:
+            PNG-encoded image
+        """
+        img = self._template.copy()
+
+        # === POSITION INFO ===
+        y_pos = 170
+
+        # Position/outcome name (bold, white) - a handful of repeated values
+        self._paste_text(
+            img,
+            (60 + self._position_label_width + 15, y_pos),
             data.outcome.upper(),
             font=self.position_font,
             fill=self.TEXT_WHITE
         )
 
-        # Market question
+        # Market question (repeats across users sharing the same market)
         y_pos = 220
-        draw.text(
+        self._paste_text(
+            img,
             (60, y_pos),
             data.market_question,
             font=self.market_font,
@@ -152,21 +322,11 @@ class TradeCardGenerator:
         )
 
         # === TOTAL RETURN (Hero element) ===
-        y_pos = 320
-
-        # "TOTAL RETURN" label
-        draw.text(
-            (60, y_pos),
-            "TOTAL RETURN",
-            font=self.label_font,
-            fill=self.TEXT_GRAY
-        )
-
         # Large percentage
         y_pos = 360
-        roi_color = self.PROFIT_COLOR if data.pnl_percentage >= 0 else self.LOSS_COLOR
-        roi_sign = "+" if data.pnl_percentage >= 0 else ""
-        draw.text(
+        roi_sign, roi_color = self.ROI_STYLES[data.pnl_percentage >= 0]
+        self._paste_number(
+            img,
             (60, y_pos),
             f"{roi_sign}{data.pnl_percentage:.2f}%",
             font=self.percentage_font,
@@ -174,18 +334,79 @@ class TradeCardGenerator:
         )
 
         # === RIGHT SIDE: Market image ===
-        self._draw_market_image(draw, img, data)
+        has_photo = self._draw_market_image(img, data)
 
-        # === BOTTOM: Footer with QR ===
-        self._draw_footer(draw, img, data)
+        # === BOTTOM: QR code ===
+        self._draw_qr_code(img, data)
 
-        # Save to buffer
-        buffer = io.BytesIO()
-        buffer.name = 'trade_card.png'
-        img.save(buffer, 'PNG', quality=95)
-        buffer.seek(0)
+        # Cards without a photo only use a few flat colors + text edges
+        return self._encode_png(img, palette=not has_photo)
 
-        return buffer
+    def generate_batch(
+        self,
+        datas: list[TradeCardData],
+        max_workers: Optional[int] = None,
+    ) -> list[io.BytesIO]:
+        """
+        Generate several trade cards concurrently.
+
+        Pillow releases the GIL while encoding and resampling, so cards
+        rendered in separate threads overlap across cores.
+
+        Args:
+            datas: Trade card data for each card
+            max_workers: Thread pool size (defaults to the executor's own)
+
+        Returns:
+            BytesIO buffers in the same order as datas
+        """
+        if len(datas) <= 1:
+            return [self.generate(data) for data in datas]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(self.generate, datas))
+
+    def _encode_png(self, img: Image, palette: bool = False) -> bytes:
+        """
+        Encode the card as PNG and release its pixel buffer right away.
+
+        Args:
+            img: Rendered card (closed after encoding)
+            palette: Quantize to a palette first; zlib then deflates one
+                byte per pixel instead of three (only for flat-color cards)
+
+        Returns:
+            PNG-encoded image
+        """
+        buffer = io.BytesIO()
+        with img:
+            out = img
+            if palette:
+                out = img.quantize(
+                    colors=self.PALETTE_COLORS,
+                    method=Image.Quantize.FASTOCTREE,
+                    dither=Image.Dither.NONE,
+                )
+            # quality is ignored for PNG; the zlib level is the cost
+            out.save(buffer, 'PNG', compress_level=1)
+
+        return buffer.getvalue()
+
+    def _paste_text(self, img: Image, pos: tuple[int, int], text: str, font, fill):
+        """Draw text from a cached glyph mask (same pixels as draw.text)."""
+        if not text:
+            return
+        mask, (dx, dy) = _text_mask(text, font)
+        img.paste(fill, (pos[0] + dx, pos[1] + dy), mask)
+
+    def _paste_number(self, img: Image, pos: tuple[int, int], text: str, font, fill):
+        """Draw short numeric text glyph by glyph from the cached atlas."""
+        x, y = pos
+        for char in text:
+            mask, (dx, dy), advance = _glyph(char, font)
+            if mask.width and mask.height:
+                img.paste(fill, (round(x) + dx, y + dy), mask)
+            x += advance
 
     def _draw_polybot_logo(self, draw: ImageDraw, x: int, y: int, size: int):
         """Draw a simple PolyBot logo (geometric placeholder)."""
@@ -209,65 +430,53 @@ class TradeCardGenerator:
         ]
         draw.polygon(points, fill=self.TEXT_GRAY)
 
-    def _draw_market_image(self, draw: ImageDraw, img: Image, data: TradeCardData):
-        """Draw market image area on the right side."""
-        # Position for market image (right side)
-        img_size = 280
-        img_x = self.CARD_WIDTH - img_size - 80
-        img_y = 60
-        corner_radius = 20
-
-        # Try to load market image from URL
-        market_img = None
-        if data.market_image_url:
-            market_img = self._fetch_image(data.market_image_url)
-
-        if market_img:
-            # Resize image to fit the square
-            market_img = market_img.convert('RGB')
-            market_img = market_img.resize((img_size, img_size), Image.Resampling.LANCZOS)
-
-            # Create rounded corners mask
-            mask = Image.new('L', (img_size, img_size), 0)
-            mask_draw = ImageDraw.Draw(mask)
-            mask_draw.rounded_rectangle(
-                [0, 0, img_size, img_size],
-                radius=corner_radius,
-                fill=255
-            )
+    def _draw_market_placeholder(self, draw: ImageDraw):
+        """Draw the placeholder shown when a market has no image."""
+        img_x, img_y, img_size = self.MARKET_IMG_X, self.MARKET_IMG_Y, self.MARKET_IMG_SIZE
+
+        # Stay within the square a market image is pasted over
+        rect = [img_x, img_y, img_x + img_size - 1, img_y + img_size - 1]
+        draw.rounded_rectangle(rect, radius=self.MARKET_IMG_RADIUS, fill=(30, 60, 120))
+
+        # Draw simple placeholder icon
+        center_x = img_x + img_size // 2
+        center_y = img_y + img_size // 2
+        icon_color = (60, 100, 180)
+        draw.rectangle(
+            [center_x - 40, center_y - 20, center_x + 40, center_y + 40],
+            fill=icon_color
+        )
 
-            # Apply rounded corners to market image
-            rounded_img = Image.new('RGB', (img_size, img_size), self.BG_COLOR)
-            rounded_img.paste(market_img, (0, 0), mask)
-
-            # Paste onto main image
-            img.paste(rounded_img, (img_x, img_y))
-        else:
-            # Draw placeholder if no image available
-            rect = [img_x, img_y, img_x + img_size, img_y + img_size]
-            draw.rounded_rectangle(rect, radius=corner_radius, fill=(30, 60, 120))
-
-            # Draw simple placeholder icon
-            center_x = img_x + img_size // 2
-            center_y = img_y + img_size // 2
-            icon_color = (60, 100, 180)
-            draw.rectangle(
-                [center_x - 40, center_y - 20, center_x + 40, center_y + 40],
-                fill=icon_color
-            )
+    def _draw_market_image(self, img: Image, data: TradeCardData) -> bool:
+        """
+        Paste the market image over the placeholder, if one is available.
+
+        Returns:
+            True if a market photo was drawn
+        """
+        if not data.market_image_url:
+            return False
+
+        tile = self._fetch_image(data.market_image_url)
+        if not tile:
+            return False
+
+        # Tile is already rounded, so it fully covers the placeholder
+        img.paste(tile, (self.MARKET_IMG_X, self.MARKET_IMG_Y))
+        return True
 
     def _fetch_image(self, url: str) -> Optional[Image.Image]:
-        """Fetch an image from URL."""
+        """Fetch a market image from URL as a finished rounded tile."""
         try:
-            response = httpx.get(url, timeout=10.0, follow_redirects=True)
-            response.raise_for_status()
-            return Image.open(io.BytesIO(response.content))
+            return _load_market_tile(
+                url, self.MARKET_IMG_SIZE, self.MARKET_IMG_RADIUS, self.BG_COLOR
+            )
         except Exception:
             return None
 
-    def _draw_footer(self, draw: ImageDraw, img: Image, data: TradeCardData):
-        """Draw the footer section with QR code."""
-        y_start = self.CARD_HEIGHT - 130
+    def _draw_footer_static(self, draw: ImageDraw):
+        """Draw the footer separator and text next to the QR code."""
+        y_start = self.CARD_HEIGHT - self.FOOTER_HEIGHT
 
         # Draw separator line
         draw.line(
@@ -276,29 +485,8 @@ class TradeCardGenerator:
             width=1
         )
 
-        # Generate QR code
-        qr = qrcode.QRCode(
-            version=1,
-            error_correction=qrcode.constants.ERROR_CORRECT_L,
-            box_size=4,
-            border=1,
-        )
-        qr.add_data(data.referral_link)
-        qr.make(fit=True)
-        qr_img = qr.make_image(fill_color="white", back_color=self.BG_COLOR)
-        qr_img = qr_img.convert('RGB')
-
-        # Resize QR code
-        qr_size = 90
-        qr_img = qr_img.resize((qr_size, qr_size), Image.Resampling.LANCZOS)
-
-        # Paste QR code on left side
-        qr_x = 60
-        qr_y = y_start + 20
-        img.paste(qr_img, (qr_x, qr_y))
-
         # Text next to QR
-        text_x = qr_x + qr_size + 25
+        text_x = self.QR_X + self.QR_SIZE + 25
         text_y = y_start + 35
 
         draw.text(
@@ -315,15 +503,31 @@ class TradeCardGenerator:
             fill=self.TEXT_GRAY
         )
 
-    def _truncate_text(self, text: str, max_chars: int) -> str:
-        """Truncate text with ellipsis if too long."""
-        if len(text) <= max_chars:
-            return text
-        return text[:max_chars - 3] + "..."
+    def _draw_qr_code(self, img: Image, data: TradeCardData):
+        """Draw the referral QR code in the footer."""
+        y_start = self.CARD_HEIGHT - self.FOOTER_HEIGHT
+
+        qr_img = _render_qr(data.referral_link, self.QR_SIZE, self.BG_COLOR)
+
+        # Paste QR code on left side, centred on its QR_SIZE slot
+        offset = (self.QR_SIZE - qr_img.width) // 2
+        img.paste(qr_img, (self.QR_X + offset, y_start + 20 + offset))
+
+
+# Shared generator (lazy-initialized); holds no per-card state
+_generator: Optional[TradeCardGenerator] = None
+
+
+def get_trade_card_generator() -> TradeCardGenerator:
+    """Get or create the shared TradeCardGenerator instance."""
+    global _generator
+    if _generator is None:
+        _generator = TradeCardGenerator()
+    return _generator
 
 
 # Convenience function
-def generate_trade_card(
+async def generate_trade_card(
     market_question: str,
     outcome: str,
     entry_price: float,
@@ -335,8 +539,13 @@ def generate_trade_card(
     referral_link: str,
     market_image_url: Optional[str] = None,
 ) -> io.BytesIO:
-    """Generate a trade card image."""
-    generator = TradeCardGenerator()
+    """
+    Generate a trade card image.
+
+    Rendering and PNG encoding are CPU-bound, so they run in a worker
+    thread to keep the event loop responsive.
+    """
+    generator = get_trade_card_generator()
     data = TradeCardData(
         market_question=market_question,
         outcome=outcome,
@@ -348,4 +557,4 @@ def generate_trade_card(
         referral_link=referral_link,
         market_image_url=market_image_url,
     )
-    return generator.generate(data)
+    return await asyncio.to_thread(generator.generate, data)
@@ -1,26 +1,84 @@
 """Polymarket CLOB API client wrapper."""
 
+import asyncio
 import logging
-from typing import Optional, Dict, Any, List
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-
-from py_clob_client.client import ClobClient
-from py_clob_client.clob_types import (
-    ApiCreds,
-    MarketOrderArgs,
-    OrderArgs,
-    OrderType,
-    BalanceAllowanceParams,
-    AssetType,
-)
-from py_clob_client.order_builder.constants import BUY, SELL
-from py_builder_signing_sdk.config import BuilderConfig
-from py_builder_signing_sdk.sdk_types import BuilderApiKeyCreds
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
 from config import settings
 
+# py_clob_client and py_builder_signing_sdk pull in eth_account, web3 and
+# friends, so they are imported where used rather than at module load. This
+# keeps importing core.polymarket (e.g. for Market) cheap for processes that
+# never trade, such as the news bot.
+if TYPE_CHECKING:
+    from py_clob_client.clob_types import ApiCreds
+
 logger = logging.getLogger(__name__)
 
+# py_clob_client is synchronous; its calls run on these pools so they don't
+# block the event loop. Shared across all per-user PolymarketCLOB instances.
+# Network calls (post/cancel/fetch) and order building/signing get separate
+# pools so a burst of slow requests can't queue signing work behind them.
+_io_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="clob-io")
+_sign_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 2, thread_name_prefix="clob-sign")
+
+# Seconds an order book fetch is reused for the same token
+ORDER_BOOK_CACHE_TTL = 0.1
+
+# Optional live top-of-book source (e.g. the market websocket feed), see
+# set_book_state_provider. Returns (best_bid, best_ask) or None if unknown.
+_book_state_provider: Optional[Callable[[str], Optional[Tuple[Optional[float], Optional[float]]]]] = None
+
+
+def set_book_state_provider(
+    provider: Optional[Callable[[str], Optional[Tuple[Optional[float], Optional[float]]]]],
+) -> None:
+    """Register a live top-of-book source consulted before fetching the REST book."""
+    global _book_state_provider
+    _book_state_provider = provider
+
+
+# User-friendly messages for known CLOB order errors, as (phrase, message)
+# pairs checked in priority order: the CLOB reports a missing approval as
+# "not enough balance / allowance", which must map to the allowance message
+_ALLOWANCE_ERROR = ("allowance", "USDC allowance not set. Please approve USDC for trading.")
+_BALANCE_ERRORS = (
+    ("not enough balance", "Insufficient balance"),
+    ("insufficient", "Insufficient balance"),
+)
+_MARKET_ORDER_ERRORS = (
+    ("no orderbook exists", "This market has no active orders. Try a different market or use a limit order."),
+    _ALLOWANCE_ERROR,
+    *_BALANCE_ERRORS,
+    ("no match", "No matching orders available at this price. The market may have low liquidity - try a limit order instead or a smaller amount."),
+)
+_LIMIT_ORDER_ERRORS = (
+    _ALLOWANCE_ERROR,
+    *_BALANCE_ERRORS,
+)
+
+
+def _friendly_order_error(error: Exception, known_errors: Tuple[Tuple[str, str], ...]) -> str:
+    """Map a CLOB order exception to a user-facing message.
+
+    Args:
+        error: Exception raised by the CLOB client
+        known_errors: (phrase, message) pairs, highest priority first
+
+    Returns:
+        Message for the first phrase found in the error, or the error text
+    """
+    error_str = str(error)
+    error_lower = error_str.lower()
+    for phrase, message in known_errors:
+        if phrase in error_lower:
+            return message
+    return error_str
+
 
 @dataclass
 class OrderResult:
@@ -38,6 +96,7 @@ class PolymarketCLOB:
         self,
         private_key: str,
         funder_address: Optional[str] = None,
+        api_creds: Optional[Dict[str, str]] = None,
     ):
         """
         Initialize CLOB client for EOA wallet.
@@ -45,7 +104,14 @@ class PolymarketCLOB:
         Args:
             private_key: Wallet private key for signing
             funder_address: Optional funder address (defaults to wallet address)
+            api_creds: Previously stored API credentials (as returned by
+                api_credentials); when given, initialize() skips derivation
         """
+        from py_builder_signing_sdk.config import BuilderConfig
+        from py_builder_signing_sdk.sdk_types import BuilderApiKeyCreds
+        from py_clob_client.client import ClobClient
+        from py_clob_client.clob_types import AssetType, BalanceAllowanceParams
+
         self.private_key = private_key
         self.funder_address = funder_address
 
@@ -74,19 +140,57 @@ class PolymarketCLOB:
             builder_config=builder_config,
         )
 
-        self._api_creds: Optional[ApiCreds] = None
+        self._builder_enabled = builder_config is not None
+        # USDC (collateral) balance/allowance query, identical on every call.
+        # Uses EOA signature type (0).
+        self._collateral_params = BalanceAllowanceParams(
+            asset_type=AssetType.COLLATERAL,
+            signature_type=0,
+        )
+        # token_id -> (fetched_at, order book), see _fetch_order_book
+        self._book_cache: Dict[str, Tuple[float, Any]] = {}
+        self._api_creds: Optional["ApiCreds"] = None
+        if api_creds:
+            self.set_api_credentials(**api_creds)
 
     async def initialize(self) -> None:
-        """Initialize API credentials."""
+        """Initialize API credentials.
+
+        No-op when credentials were already supplied, which saves the signed
+        round-trip to derive them again.
+        """
+        if self._api_creds is not None:
+            return
+
         try:
             # Create or derive API credentials
-            self._api_creds = self.client.create_or_derive_api_creds()
+            self._api_creds = await self._run(self.client.create_or_derive_api_creds)
             self.client.set_api_creds(self._api_creds)
             logger.info("CLOB client initialized with API credentials")
         except Exception as e:
             logger.error(f"Failed to initialize CLOB client: {e}")
             raise
 
+    async def _run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking py_clob_client network call on the I/O pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_io_executor, fn, *args)
+
+    async def _sign(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run a py_clob_client order build/sign call on the signing pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_sign_executor, fn, *args)
+
+    async def _fetch_order_book(self, token_id: str) -> Any:
+        """Fetch a token's order book, reusing one fetched within ORDER_BOOK_CACHE_TTL."""
+        cached = self._book_cache.get(token_id)
+        if cached is not None and time.monotonic() - cached[0] < ORDER_BOOK_CACHE_TTL:
+            return cached[1]
+
+        book = await self._run(self.client.get_order_book, token_id)
+        self._book_cache[token_id] = (time.monotonic(), book)
+        return book
+
     @property
     def api_credentials(self) -> Optional[Dict[str, str]]:
         """Get API credentials for storage."""
@@ -105,6 +209,8 @@ class PolymarketCLOB:
         api_passphrase: str,
     ) -> None:
         """Set API credentials from stored values."""
+        from py_clob_client.clob_types import ApiCreds
+
         self._api_creds = ApiCreds(
             api_key=api_key,
             api_secret=api_secret,
@@ -129,20 +235,35 @@ class PolymarketCLOB:
         Returns:
             OrderResult with success status and order ID
         """
+        from py_clob_client.clob_types import MarketOrderArgs, OrderType
+        from py_clob_client.order_builder.constants import BUY, SELL
+
         try:
             # Use the correct side constant
             side_const = BUY if side.upper() == "BUY" else SELL
 
             # Create market order using MarketOrderArgs (per documentation)
-            order = self.client.create_market_order(
+            t_start = time.perf_counter()
+            order = await self._sign(
+                self.client.create_market_order,
                 MarketOrderArgs(
                     token_id=token_id,
                     amount=amount,
                     side=side_const,
-                )
+                ),
+            )
+            t_signed = time.perf_counter()
+
+            result = await self._run(self.client.post_order, order, OrderType.FOK)
+            t_posted = time.perf_counter()
+            logger.info(
+                f"Market order latency for {token_id[:16]}...: "
+                f"sign={(t_signed - t_start) * 1000:.1f}ms "
+                f"post={(t_posted - t_signed) * 1000:.1f}ms"
             )
 
-            result = self.client.post_order(order, OrderType.FOK)
+            # Our order may have changed the book
+            self._book_cache.pop(token_id, None)
 
             if result and "orderID" in result:
                 return OrderResult(
@@ -160,17 +281,7 @@ class PolymarketCLOB:
             logger.error(f"Market order failed: {e}")
 
             # Provide user-friendly error messages
-            error_str = str(e).lower()
-            if "no orderbook exists" in error_str:
-                error_msg = "This market has no active orders. Try a different market or use a limit order."
-            elif "allowance" in error_str:
-                error_msg = "USDC allowance not set. Please approve USDC for trading."
-            elif "not enough balance" in error_str or "insufficient" in error_str:
-                error_msg = "Insufficient balance"
-            elif "no match" in error_str:
-                error_msg = "No matching orders available at this price. The market may have low liquidity - try a limit order instead or a smaller amount."
-            else:
-                error_msg = str(e)
+            error_msg = _friendly_order_error(e, _MARKET_ORDER_ERRORS)
 
             return OrderResult(success=False, error=error_msg)
 
@@ -193,6 +304,9 @@ class PolymarketCLOB:
         Returns:
             OrderResult with success status and order ID
         """
+        from py_clob_client.clob_types import OrderArgs, OrderType
+        from py_clob_client.order_builder.constants import BUY, SELL
+
         try:
             # Validate price bounds
             if price < 0.01 or price > 0.99:
@@ -205,16 +319,28 @@ class PolymarketCLOB:
             side_const = BUY if side.upper() == "BUY" else SELL
 
             # Create the order
-            order = self.client.create_order(
+            t_start = time.perf_counter()
+            order = await self._sign(
+                self.client.create_order,
                 OrderArgs(
                     token_id=token_id,
                     price=price,
                     size=size,
                     side=side_const,
-                )
+                ),
+            )
+            t_signed = time.perf_counter()
+
+            result = await self._run(self.client.post_order, order, OrderType.GTC)
+            t_posted = time.perf_counter()
+            logger.info(
+                f"Limit order latency for {token_id[:16]}...: "
+                f"sign={(t_signed - t_start) * 1000:.1f}ms "
+                f"post={(t_posted - t_signed) * 1000:.1f}ms"
             )
 
-            result = self.client.post_order(order, OrderType.GTC)
+            # Our order may have changed the book
+            self._book_cache.pop(token_id, None)
 
             if result and "orderID" in result:
                 return OrderResult(
@@ -232,13 +358,7 @@ class PolymarketCLOB:
             logger.error(f"Limit order failed: {e}")
 
             # Provide user-friendly error messages
-            error_str = str(e).lower()
-            if "allowance" in error_str:
-                error_msg = "USDC allowance not set. Please approve USDC for trading."
-            elif "not enough balance" in error_str or "insufficient" in error_str:
-                error_msg = "Insufficient balance"
-            else:
-                error_msg = str(e)
+            error_msg = _friendly_order_error(e, _LIMIT_ORDER_ERRORS)
 
             return OrderResult(success=False, error=error_msg)
 
@@ -253,7 +373,8 @@ class PolymarketCLOB:
             True if cancelled successfully
         """
         try:
-            result = self.client.cancel(order_id)
+            result = await self._run(self.client.cancel, order_id)
+            self._book_cache.clear()
             return result is not None
         except Exception as e:
             logger.error(f"Cancel order failed: {e}")
@@ -267,7 +388,8 @@ class PolymarketCLOB:
             Number of orders cancelled
         """
         try:
-            result = self.client.cancel_all()
+            result = await self._run(self.client.cancel_all)
+            self._book_cache.clear()
             return len(result) if result else 0
         except Exception as e:
             logger.error(f"Cancel all orders failed: {e}")
@@ -281,7 +403,7 @@ class PolymarketCLOB:
             List of open orders
         """
         try:
-            orders = self.client.get_orders()
+            orders = await self._run(self.client.get_orders)
             return orders if orders else []
         except Exception as e:
             logger.error(f"Get open orders failed: {e}")
@@ -298,7 +420,7 @@ class PolymarketCLOB:
             Order details or None
         """
         try:
-            return self.client.get_order(order_id)
+            return await self._run(self.client.get_order, order_id)
         except Exception as e:
             logger.error(f"Get order failed: {e}")
             return None
@@ -314,7 +436,7 @@ class PolymarketCLOB:
             List of trades
         """
         try:
-            trades = self.client.get_trades()
+            trades = await self._run(self.client.get_trades)
             return trades[:limit] if trades else []
         except Exception as e:
             logger.error(f"Get trades failed: {e}")
@@ -328,17 +450,46 @@ class PolymarketCLOB:
             token_id: The token ID
 
         Returns:
-            Order book with bids and asks
+            Order book as parallel price/size lists per side:
+            bid_prices, bid_sizes, ask_prices, ask_sizes
         """
         try:
-            book = self.client.get_order_book(token_id)
+            book = await self._fetch_order_book(token_id)
+            bids = book.bids or []
+            asks = book.asks or []
             return {
-                "bids": [{"price": b.price, "size": b.size} for b in book.bids] if book.bids else [],
-                "asks": [{"price": a.price, "size": a.size} for a in book.asks] if book.asks else [],
+                "bid_prices": [float(b.price) for b in bids],
+                "bid_sizes": [float(b.size) for b in bids],
+                "ask_prices": [float(a.price) for a in asks],
+                "ask_sizes": [float(a.size) for a in asks],
             }
         except Exception as e:
             logger.error(f"Get order book failed: {e}")
-            return {"bids": [], "asks": []}
+            return {"bid_prices": [], "bid_sizes": [], "ask_prices": [], "ask_sizes": []}
+
+    async def get_top_of_book(self, token_id: str) -> Tuple[Optional[float], Optional[float]]:
+        """
+        Get best bid and best ask from a single order book fetch.
+
+        Args:
+            token_id: The token ID
+
+        Returns:
+            (best_bid, best_ask), each None if that side is empty
+        """
+        if _book_state_provider is not None:
+            streamed = _book_state_provider(token_id)
+            if streamed is not None:
+                return streamed
+
+        try:
+            book = await self._fetch_order_book(token_id)
+            best_bid = float(book.bids[0].price) if book.bids else None
+            best_ask = float(book.asks[0].price) if book.asks else None
+            return best_bid, best_ask
+        except Exception as e:
+            logger.error(f"Get top of book failed: {e}")
+            return None, None
 
     async def get_best_price(self, token_id: str, side: str) -> Optional[float]:
         """
@@ -351,22 +502,9 @@ class PolymarketCLOB:
         Returns:
             Best price or None if no orders
         """
-        try:
-            book = self.client.get_order_book(token_id)
-
-            if side.upper() == "BUY":
-                # Best price to buy is lowest ask
-                if book.asks:
-                    return float(book.asks[0].price)
-            else:
-                # Best price to sell is highest bid
-                if book.bids:
-                    return float(book.bids[0].price)
-
-            return None
-        except Exception as e:
-            logger.error(f"Get best price failed: {e}")
-            return None
+        best_bid, best_ask = await self.get_top_of_book(token_id)
+        # Best price to buy is lowest ask, best price to sell is highest bid
+        return best_ask if side.upper() == "BUY" else best_bid
 
     async def get_builder_trades(self) -> List[Dict[str, Any]]:
         """
@@ -376,11 +514,11 @@ class PolymarketCLOB:
             List of trades credited to your builder
         """
         try:
-            if not settings.poly_builder_api_key:
+            if not self._builder_enabled:
                 logger.warning("Builder credentials not configured - cannot fetch builder trades")
                 return []
 
-            trades = self.client.get_builder_trades()
+            trades = await self._run(self.client.get_builder_trades)
             return trades if trades else []
         except Exception as e:
             logger.error(f"Get builder trades failed: {e}")
@@ -394,12 +532,7 @@ class PolymarketCLOB:
             Dict with allowance information
         """
         try:
-            # Use EOA signature type (0)
-            params = BalanceAllowanceParams(
-                asset_type=AssetType.COLLATERAL,
-                signature_type=0,
-            )
-            result = self.client.get_balance_allowance(params)
+            result = await self._run(self.client.get_balance_allowance, self._collateral_params)
             return result if result else {}
         except Exception as e:
             logger.error(f"Check allowance failed: {e}")
@@ -419,6 +552,8 @@ class PolymarketCLOB:
         Returns:
             Dict with balance and allowance information
         """
+        from py_clob_client.clob_types import AssetType, BalanceAllowanceParams
+
         try:
             # Use EOA signature type (0)
             params = BalanceAllowanceParams(
@@ -426,7 +561,7 @@ class PolymarketCLOB:
                 token_id=token_id,
                 signature_type=0,
             )
-            result = self.client.get_balance_allowance(params)
+            result = await self._run(self.client.get_balance_allowance, params)
             logger.info(f"CTF balance/allowance for {token_id[:16]}...: {result}")
             return result if result else {}
         except Exception as e:
@@ -444,13 +579,7 @@ class PolymarketCLOB:
             True if successful
         """
         try:
-            # Use EOA signature type (0)
-            params = BalanceAllowanceParams(
-                asset_type=AssetType.COLLATERAL,
-                signature_type=0,
-            )
-
-            result = self.client.update_balance_allowance(params)
+            result = await self._run(self.client.update_balance_allowance, self._collateral_params)
             logger.info(f"Allowance set successfully: {result}")
             return True
         except Exception as e:
@@ -1,21 +1,221 @@
 """Polymarket Gamma API client for market data."""
 
+import asyncio
+import contextlib
 import logging
+import random
 import re
-from typing import Optional, List, Dict, Any
+import sys
+import time
+from itertools import islice
+from typing import Optional, List, Dict, Any, AsyncIterator, Awaitable, Callable
 from dataclasses import dataclass
 
 import httpx
+import ijson
+import orjson
 
 from config import settings
 from utils.slug_sanitizer import sanitize_slug
 
 logger = logging.getLogger(__name__)
 
+# Seconds a Gamma response is served from memory before refetching
+EVENTS_CACHE_TTL = 15.0
+TAGS_CACHE_TTL = 30.0
+PRICE_CACHE_TTL = 5.0
 
-@dataclass
+# Window for collecting condition IDs into one /markets request, and max IDs per
+# request (a full batch is sent without waiting out the window)
+MARKET_BATCH_WINDOW = 0.005
+MARKET_BATCH_MAX = 50
+
+# Condition ID lookups allowed in flight at once for bulk lookups
+MARKET_LOOKUP_CONCURRENCY = 15
+
+# How long a market seen in an /events listing answers condition ID lookups
+CONDITION_INDEX_TTL = 60.0
+CONDITION_INDEX_MAX_ENTRIES = 10_000
+
+# /events pages walked when a condition ID isn't in /markets or the index
+CONDITION_SEARCH_PAGES = 3
+CONDITION_SEARCH_PAGE_SIZE = 200
+
+# Endpoints outside the Gamma host used for trader stats and the leaderboard
+PROFILE_URL = "https://polymarket.com/api/profile"
+CLOB_ACTIVITY_URL = httpx.URL("https://clob.polymarket.com/activity")
+LEADERBOARD_URL = httpx.URL("https://data-api.polymarket.com/v1/leaderboard")
+
+# Retries for a Gamma request that timed out, dropped or got a 5xx, and the
+# base delay between them (jittered)
+GAMMA_RETRIES = 2
+GAMMA_RETRY_BACKOFF = 0.05
+
+# Consecutive failed Gamma requests that open the circuit, and how long it
+# stays open (requests fail fast instead of queueing on a down API)
+CIRCUIT_FAILURE_THRESHOLD = 3
+CIRCUIT_OPEN_SECONDS = 5.0
+
+# Upper bound on cached responses; the oldest entry is dropped beyond this
+RESPONSE_CACHE_MAX_ENTRIES = 1024
+
+
+def _json_list(value: Any) -> list:
+    """Return value as a list, decoding it if the API sent a JSON-encoded string."""
+    if isinstance(value, list):
+        return value
+    if isinstance(value, str) and value:
+        try:
+            decoded = orjson.loads(value)
+        except orjson.JSONDecodeError:
+            return []
+        return decoded if isinstance(decoded, list) else []
+    return []
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Intern a string that repeats across many markets, so copies share memory."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _float_field(data: Dict[str, Any], key: str) -> float:
+    """Return data[key] as a float, treating a missing/empty/null value as 0."""
+    value = data.get(key)
+    return float(value) if value else 0.0
+
+
+def _int_field(data: Dict[str, Any], key: str) -> int:
+    """Return data[key] as an int, treating a missing/empty/null value as 0."""
+    value = data.get(key)
+    return int(value) if value else 0
+
+
+def _leaderboard_row(entry: Dict[str, Any], address: str = "") -> Dict[str, Any]:
+    """Map a Data API leaderboard entry to the trader dict callers use."""
+    get = entry.get
+    return {
+        "address": get("proxyWallet", address),
+        "name": get("userName", "Anonymous"),
+        "pnl": _float_field(entry, "pnl"),
+        "volume": _float_field(entry, "vol"),
+        "rank": _int_field(entry, "rank"),
+        "profile_image": get("profileImage", ""),
+        "x_username": get("xUsername", ""),
+        "verified": get("verifiedBadge", False),
+    }
+
+
+# One HTTP client (and connection pool) shared by every GammaMarketClient, so
+# market, leaderboard and resolution lookups reuse the same TLS connections
+_shared_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_shared_client() -> httpx.AsyncClient:
+    """Get or create the shared HTTP client."""
+    global _shared_client
+    if _shared_client is None:
+        # HTTP/2 multiplexes concurrent Gamma requests over one kept-alive
+        # connection, so only the first request pays the TLS handshake.
+        # Failed connection attempts are retried by the transport.
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            retries=2,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=30,
+                keepalive_expiry=60.0,
+            ),
+        )
+        _shared_client = httpx.AsyncClient(
+            transport=transport,
+            timeout=httpx.Timeout(10.0, connect=3.0),
+            headers={"user-agent": "polybot/1.0"},
+        )
+    return _shared_client
+
+
+async def close_gamma_client() -> None:
+    """Close the shared HTTP client (call on application shutdown)."""
+    global _shared_client
+    if _shared_client is not None:
+        client, _shared_client = _shared_client, None
+        await client.aclose()
+
+
+# Circuit breaker state for the Gamma API, shared like the HTTP client
+_consecutive_failures = 0
+_circuit_open_until = 0.0
+
+
+def _record_gamma_result(ok: bool) -> None:
+    """Update the circuit breaker after a Gamma request finishes."""
+    global _consecutive_failures, _circuit_open_until
+    if ok:
+        _consecutive_failures = 0
+        return
+    _consecutive_failures += 1
+    if _consecutive_failures >= CIRCUIT_FAILURE_THRESHOLD:
+        _circuit_open_until = time.monotonic() + CIRCUIT_OPEN_SECONDS
+        _consecutive_failures = 0
+        logger.warning(f"Gamma API failing, pausing requests for {CIRCUIT_OPEN_SECONDS}s")
+
+
+# condition_id -> (seen_at, Market) for every market parsed from /events,
+# shared by all clients so any listing can answer a later lookup. A None
+# market records a recent /events search that didn't find the ID.
+_condition_index: Dict[str, tuple[float, Optional["Market"]]] = {}
+
+
+def _lookup_condition(condition_id: str) -> tuple[bool, Optional["Market"]]:
+    """
+    Look up a condition ID in the recent /events index.
+
+    Returns:
+        (known, market): known is False if the ID hasn't been seen or
+        searched for within CONDITION_INDEX_TTL; market is None for a
+        recorded miss
+    """
+    entry = _condition_index.get(condition_id)
+    if entry is None:
+        return False, None
+    seen_at, market = entry
+    if time.monotonic() - seen_at >= CONDITION_INDEX_TTL:
+        del _condition_index[condition_id]
+        return False, None
+    return True, market
+
+
+def _prune_condition_index() -> None:
+    """Drop condition index entries older than CONDITION_INDEX_TTL."""
+    cutoff = time.monotonic() - CONDITION_INDEX_TTL
+    for condition_id in [cid for cid, (seen_at, _) in _condition_index.items() if seen_at < cutoff]:
+        del _condition_index[condition_id]
+
+
+class _AsyncByteReader:
+    """Adapts an async byte iterator to the async read() interface ijson expects."""
+
+    def __init__(self, chunks: AsyncIterator[bytes]):
+        self._chunks = chunks.__aiter__()
+
+    async def read(self, size: int = -1) -> bytes:
+        # ijson probes with read(0) to detect bytes vs str; don't consume a chunk
+        if size == 0:
+            return b""
+        # An empty chunk would read as EOF, so skip any the transport yields
+        async for chunk in self._chunks:
+            if chunk:
+                return chunk
+        return b""
+
+
+@dataclass(slots=True, frozen=True)
 class Market:
-    """Market data model."""
+    """Market data model.
+
+    Immutable, since instances are shared between callers through the
+    response cache.
+    """
     condition_id: str
     question: str
     description: Optional[str]
@@ -36,15 +236,19 @@ class Market:
     outcomes_count: int = 1  # Number of outcomes in parent event
 
     @classmethod
-    def from_api(cls, data: Dict[str, Any], market_data: Dict[str, Any] = None) -> "Market":
+    def from_api(
+        cls,
+        data: Dict[str, Any],
+        market_data: Dict[str, Any] = None,
+        outcomes_count: Optional[int] = None,
+    ) -> "Market":
         """Create Market from API response.
 
         Args:
             data: Event data from API
             market_data: Optional specific market data (for multi-outcome events)
+            outcomes_count: Number of markets in the event, if already known
         """
-        import json
-
         # Use provided market_data or extract from event
         if market_data:
             market = market_data
@@ -53,29 +257,20 @@ class Market:
             market = markets[0] if markets else data
 
         # Get token IDs - may be string or list
-        tokens = market.get("clobTokenIds", [])
-        if isinstance(tokens, str):
-            try:
-                tokens = json.loads(tokens)
-            except (json.JSONDecodeError, TypeError):
-                tokens = []
+        tokens = _json_list(market.get("clobTokenIds"))
         yes_token_id = tokens[0] if len(tokens) > 0 else ""
         no_token_id = tokens[1] if len(tokens) > 1 else ""
 
         # Get prices from outcomes - may be string or list
-        outcomes = market.get("outcomePrices", [])
-        if isinstance(outcomes, str):
-            try:
-                outcomes = json.loads(outcomes)
-            except (json.JSONDecodeError, TypeError):
-                outcomes = []
+        outcomes = _json_list(market.get("outcomePrices"))
 
         yes_price = float(outcomes[0]) if len(outcomes) > 0 else 0.5
         no_price = float(outcomes[1]) if len(outcomes) > 1 else 0.5
 
         # Get event info for multi-outcome tracking
-        markets_list = data.get("markets", [])
-        outcomes_count = len(markets_list) if markets_list else 1
+        if outcomes_count is None:
+            markets_list = data.get("markets", [])
+            outcomes_count = len(markets_list) if markets_list else 1
 
         # Sanitize slug using shared utility
         raw_slug = market.get("slug", data.get("slug"))
@@ -85,16 +280,16 @@ class Market:
             condition_id=market.get("conditionId", data.get("id", "")),
             question=market.get("question", data.get("title", "")),
             description=market.get("description", ""),
-            category=data.get("category", ""),
+            category=_intern(data.get("category", "")),
             image_url=data.get("image", market.get("image", "")),
             yes_token_id=yes_token_id,
             no_token_id=no_token_id,
             yes_price=yes_price,
             no_price=no_price,
-            volume_24h=float(market.get("volume24hr", 0) or 0),
+            volume_24h=_float_field(market, "volume24hr"),
             total_volume=float(market.get("volume", data.get("volume", 0)) or 0),
-            liquidity=float(market.get("liquidity", 0) or 0),
-            end_date=market.get("endDate", data.get("endDate")),
+            liquidity=_float_field(market, "liquidity"),
+            end_date=_intern(market.get("endDate", data.get("endDate"))),
             is_active=market.get("active", True) and not market.get("closed", False),
             slug=clean_slug,
             event_id=data.get("id"),
@@ -123,10 +318,14 @@ class Market:
             return [market] if market.yes_token_id else []
 
         # Multi-outcome event - parse each market
+        outcomes_count = len(markets_data)
         markets = []
         for market_data in markets_data:
+            # Outcomes without CLOB tokens aren't tradeable; skip building them
+            if not market_data.get("clobTokenIds"):
+                continue
             try:
-                market = cls.from_api(event_data, market_data)
+                market = cls.from_api(event_data, market_data, outcomes_count)
                 if market.yes_token_id:
                     markets.append(market)
             except Exception:
@@ -140,19 +339,145 @@ class GammaMarketClient:
 
     def __init__(self):
         self.host = settings.gamma_host
-        self._client: Optional[httpx.AsyncClient] = None
+        # Endpoint URLs parsed once rather than on every request
+        self._events_url = httpx.URL(f"{self.host}/events")
+        self._markets_url = httpx.URL(f"{self.host}/markets")
+        self._tags_url = httpx.URL(f"{self.host}/tags")
+        # Parsed responses keyed by endpoint and params: key -> (fetched_at, value)
+        self._cache: Dict[tuple, tuple[float, Any]] = {}
+        # Requests currently on the wire, shared by concurrent identical callers
+        self._inflight: Dict[tuple, asyncio.Task] = {}
+        # Condition IDs waiting for the next batched /markets request
+        self._pending_markets: Dict[str, asyncio.Future] = {}
+        self._market_flush_task: Optional[asyncio.Task] = None
+        self._market_batch_full = asyncio.Event()
+        # ETag and parsed value of the last full response per key, kept past
+        # the TTL so expired entries can be revalidated with If-None-Match
+        self._etags: Dict[tuple, tuple[str, Any]] = {}
+
+    def _cache_get(self, key: tuple, ttl: float) -> Any:
+        """Return a cached value younger than ttl seconds, or None."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        fetched_at, value = entry
+        if time.monotonic() - fetched_at >= ttl:
+            del self._cache[key]
+            return None
+        return value
+
+    def _cache_set(self, key: tuple, value: Any) -> None:
+        """Store a value in the response cache, evicting the oldest entry if full."""
+        self._cache.pop(key, None)
+        if len(self._cache) >= RESPONSE_CACHE_MAX_ENTRIES:
+            del self._cache[next(iter(self._cache))]
+        self._cache[key] = (time.monotonic(), value)
+
+    def _store_etag(self, key: tuple, response: httpx.Response, value: Any) -> None:
+        """Remember the response's ETag alongside its parsed value, if it has one."""
+        etag = response.headers.get("etag")
+        if not etag:
+            return
+        self._etags.pop(key, None)
+        if len(self._etags) >= RESPONSE_CACHE_MAX_ENTRIES:
+            del self._etags[next(iter(self._etags))]
+        self._etags[key] = (etag, value)
+
+    async def _single_flight(self, key: tuple, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Run fetch once for all concurrent callers sharing the same key.
+
+        Args:
+            key: Request identity (endpoint and params)
+            fetch: Zero-argument coroutine factory performing the request
+
+        Returns:
+            The result of the shared fetch
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield so one caller being cancelled doesn't cancel the others
+        return await asyncio.shield(task)
+
+    async def _get(self, url: Any, **kwargs: Any) -> httpx.Response:
+        """
+        GET a Gamma endpoint, retrying transient failures.
+
+        Timeouts, dropped connections and 5xx responses are retried up to
+        GAMMA_RETRIES times with a short jittered backoff. Repeated failures
+        open the circuit breaker, during which requests fail immediately.
+
+        Args:
+            url: Endpoint URL
+            **kwargs: Request params and headers
+
+        Returns:
+            The last response received (callers check its status)
+        """
+        return await self._send(url, stream=False, **kwargs)
+
+    @contextlib.asynccontextmanager
+    async def _stream(self, url: Any, **kwargs: Any) -> AsyncIterator[httpx.Response]:
+        """
+        Streaming GET of a Gamma endpoint, with the same retries as _get.
+
+        Failures up to the response headers are retried; a timeout or dropped
+        connection while the body is read counts against the circuit breaker.
+
+        Args:
+            url: Endpoint URL
+            **kwargs: Request params and headers
+
+        Yields:
+            The response, with its body not yet read
+        """
+        response = await self._send(url, stream=True, **kwargs)
+        try:
+            yield response
+        except (httpx.TimeoutException, httpx.RemoteProtocolError):
+            _record_gamma_result(False)
+            raise
+        finally:
+            await response.aclose()
+
+    async def _send(self, url: Any, stream: bool, **kwargs: Any) -> httpx.Response:
+        """Send a GET under the retry and circuit breaker rules of _get."""
+        if time.monotonic() < _circuit_open_until:
+            raise httpx.ConnectError("Gamma API circuit open")
+
+        client = await self._get_client()
+        attempt = 0
+        while True:
+            try:
+                response = await client.send(
+                    client.build_request("GET", url, **kwargs), stream=stream
+                )
+            except (httpx.TimeoutException, httpx.RemoteProtocolError):
+                if attempt >= GAMMA_RETRIES:
+                    _record_gamma_result(False)
+                    raise
+            else:
+                ok = response.status_code < 500
+                if ok or attempt >= GAMMA_RETRIES:
+                    _record_gamma_result(ok)
+                    return response
+                if stream:
+                    await response.aclose()
+            attempt += 1
+            await asyncio.sleep(GAMMA_RETRY_BACKOFF * (attempt + random.random()))
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
-        if self._client is None:
-            self._client = httpx.AsyncClient(timeout=30.0)
-        return self._client
+        """Get the process-wide HTTP client."""
+        return _get_shared_client()
 
     async def close(self):
-        """Close HTTP client."""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        """Release this client.
+
+        A no-op: the connection pool is shared by every GammaMarketClient in
+        the process and is closed only on shutdown via close_gamma_client().
+        """
 
     async def get_events(
         self,
@@ -177,38 +502,80 @@ class GammaMarketClient:
         Returns:
             List of Market objects
         """
-        try:
-            client = await self._get_client()
+        cache_key = ("events", active, closed, limit, offset, order, tag_id)
+        cached = self._cache_get(cache_key, EVENTS_CACHE_TTL)
+        if cached is not None:
+            return list(cached)
+
+        markets = await self._single_flight(
+            cache_key,
+            lambda: self._fetch_events(cache_key, active, closed, limit, offset, order, tag_id),
+        )
+        return list(markets)
 
-            params = {
-                "active": str(active).lower(),
-                "closed": str(closed).lower(),
-                "limit": limit,
-                "offset": offset,
-                "order": order,
-                "ascending": "false",
-            }
+    async def _fetch_events(
+        self,
+        cache_key: tuple,
+        active: bool,
+        closed: bool,
+        limit: int,
+        offset: int,
+        order: str,
+        tag_id: Optional[int],
+    ) -> List[Market]:
+        """Request /events and parse the results, caching on success."""
+        try:
+            params: tuple[tuple[str, str], ...] = (
+                ("active", "true" if active else "false"),
+                ("closed", "true" if closed else "false"),
+                ("limit", str(limit)),
+                ("offset", str(offset)),
+                ("order", order),
+                ("ascending", "false"),
+            )
 
             if tag_id:
-                params["tag_id"] = tag_id
-
-            response = await client.get(f"{self.host}/events", params=params)
-            response.raise_for_status()
+                params += (("tag_id", str(tag_id)),)
 
-            data = response.json()
             markets = []
-
-            for event in data:
-                try:
-                    # Return one market per event (use first market as representative)
-                    # Multi-outcome events will show "+X Options" link for expansion
-                    market = Market.from_api(event)
-                    if market.yes_token_id:
-                        markets.append(market)
-                except Exception as e:
-                    logger.warning(f"Failed to parse market: {e}")
-                    continue
-
+            fetched_at = time.monotonic()
+
+            # Revalidate the last listing instead of re-downloading it if unchanged
+            etag_entry = self._etags.get(cache_key)
+            headers = {"If-None-Match": etag_entry[0]} if etag_entry else None
+
+            # Stream the body and parse one event at a time, so large listings
+            # never hold the whole payload and its decoded list in memory
+            async with self._stream(self._events_url, params=params, headers=headers) as response:
+                if response.status_code == 304 and etag_entry:
+                    markets = etag_entry[1]
+                    for market in markets:
+                        _condition_index[market.condition_id] = (fetched_at, market)
+                else:
+                    response.raise_for_status()
+
+                    events = ijson.items(
+                        _AsyncByteReader(response.aiter_bytes()),
+                        "item",
+                        use_float=True,
+                    )
+                    async for event in events:
+                        try:
+                            # Return one market per event (use first market as representative)
+                            # Multi-outcome events will show "+X Options" link for expansion
+                            market = Market.from_api(event)
+                            if market.yes_token_id:
+                                markets.append(market)
+                                _condition_index[market.condition_id] = (fetched_at, market)
+                        except Exception as e:
+                            logger.warning(f"Failed to parse market: {e}")
+                            continue
+                    self._store_etag(cache_key, response, markets)
+
+            if len(_condition_index) > CONDITION_INDEX_MAX_ENTRIES:
+                _prune_condition_index()
+
+            self._cache_set(cache_key, markets)
             return markets
 
         except Exception as e:
@@ -244,15 +611,13 @@ class GammaMarketClient:
             Event data dict with markets array, or None
         """
         try:
-            client = await self._get_client()
-
-            response = await client.get(f"{self.host}/events/{event_id}")
+            response = await self._get(f"{self._events_url}/{event_id}")
 
             if response.status_code == 404:
                 return None
 
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
 
         except Exception as e:
             logger.error(f"Failed to fetch event {event_id}: {e}")
@@ -268,11 +633,33 @@ class GammaMarketClient:
         Returns:
             List of Market objects for each outcome
         """
+        cache_key = ("event_markets", event_id)
+        cached = self._cache_get(cache_key, EVENTS_CACHE_TTL)
+        if cached is not None:
+            return list(cached)
+
+        markets = await self._single_flight(
+            cache_key,
+            lambda: self._fetch_event_markets(cache_key, event_id),
+        )
+        return list(markets)
+
+    async def _fetch_event_markets(self, cache_key: tuple, event_id: str) -> List[Market]:
+        """Request an event and parse its markets, caching the parsed markets on success."""
         event_data = await self.get_event_by_id(event_id)
         if not event_data:
             return []
 
-        return Market.all_from_event(event_data)
+        markets = Market.all_from_event(event_data)
+
+        fetched_at = time.monotonic()
+        for market in markets:
+            _condition_index[market.condition_id] = (fetched_at, market)
+        _prune_condition_index()
+
+        if markets:
+            self._cache_set(cache_key, markets)
+        return markets
 
     async def get_market_by_condition_id(self, condition_id: str) -> Optional[Market]:
         """
@@ -287,19 +674,42 @@ class GammaMarketClient:
         Returns:
             Market or None if not found
         """
-        try:
-            client = await self._get_client()
+        return await self._single_flight(
+            ("market", condition_id),
+            lambda: self._fetch_market_by_condition_id(condition_id),
+        )
 
-            # Try /markets endpoint first (works for most markets)
-            response = await client.get(
-                f"{self.host}/markets",
-                params={"condition_ids": condition_id},
-            )
-            response.raise_for_status()
+    async def get_markets_by_condition_ids(
+        self,
+        condition_ids: List[str],
+    ) -> List[Optional[Market]]:
+        """
+        Get several markets by condition ID concurrently.
 
-            data = response.json()
-            if data:
-                return Market.from_api(data[0])
+        At most MARKET_LOOKUP_CONCURRENCY lookups run at once; lookups that
+        overlap are coalesced into batched /markets requests.
+
+        Args:
+            condition_ids: Market condition IDs
+
+        Returns:
+            Markets in the same order as condition_ids, None where not found
+        """
+        semaphore = asyncio.Semaphore(MARKET_LOOKUP_CONCURRENCY)
+
+        async def lookup(condition_id: str) -> Optional[Market]:
+            async with semaphore:
+                return await self.get_market_by_condition_id(condition_id)
+
+        return list(await asyncio.gather(*(lookup(c) for c in condition_ids)))
+
+    async def _fetch_market_by_condition_id(self, condition_id: str) -> Optional[Market]:
+        """Request a single market by condition ID, falling back to /events."""
+        try:
+            # Try /markets endpoint first (works for most markets)
+            market = await self._load_market(condition_id)
+            if market:
+                return market
 
             # Fallback: Search events for multi-outcome markets
             # Some markets only appear in /events but not /markets
@@ -310,6 +720,66 @@ class GammaMarketClient:
             logger.error(f"Failed to fetch market {condition_id}: {e}")
             return None
 
+    async def _load_market(self, condition_id: str) -> Optional[Market]:
+        """Queue a condition ID for the next batched /markets request.
+
+        Lookups arriving within MARKET_BATCH_WINDOW of each other are
+        resolved by a single request; a batch reaching MARKET_BATCH_MAX
+        IDs is sent straight away.
+
+        Args:
+            condition_id: Market condition ID
+
+        Returns:
+            Market or None if /markets doesn't know it
+        """
+        future = self._pending_markets.get(condition_id)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._pending_markets[condition_id] = future
+            if self._market_flush_task is None:
+                self._market_flush_task = asyncio.create_task(self._flush_market_batch())
+            elif len(self._pending_markets) >= MARKET_BATCH_MAX:
+                self._market_batch_full.set()
+        return await future
+
+    async def _flush_market_batch(self) -> None:
+        """Fetch all queued condition IDs and resolve their futures."""
+        try:
+            await asyncio.wait_for(self._market_batch_full.wait(), MARKET_BATCH_WINDOW)
+        except asyncio.TimeoutError:
+            pass
+        self._market_batch_full.clear()
+        pending, self._pending_markets = self._pending_markets, {}
+        self._market_flush_task = None
+
+        condition_ids = list(pending)
+        found: Dict[str, Dict[str, Any]] = {}
+        try:
+            for start in range(0, len(condition_ids), MARKET_BATCH_MAX):
+                chunk = condition_ids[start:start + MARKET_BATCH_MAX]
+                response = await self._get(
+                    self._markets_url,
+                    params={"condition_ids": chunk, "limit": len(chunk)},
+                )
+                response.raise_for_status()
+                for item in orjson.loads(response.content):
+                    found[str(item.get("conditionId", "")).lower()] = item
+        except Exception as e:
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for condition_id, future in pending.items():
+            if future.done():
+                continue
+            data = found.get(condition_id.lower())
+            try:
+                future.set_result(Market.from_api(data) if data else None)
+            except Exception as e:
+                future.set_exception(e)
+
     async def _search_events_for_condition_id(self, condition_id: str) -> Optional[Market]:
         """
         Search through events to find a market by condition ID.
@@ -324,13 +794,31 @@ class GammaMarketClient:
             Market or None if not found
         """
         try:
-            # Fetch recent events (sorted by volume for relevance)
-            events = await self.get_events(limit=200)
-
-            for market in events:
-                if market.condition_id == condition_id:
+            # Any recent /events listing may already have seen this market,
+            # or a recent search may already have missed it
+            known, market = _lookup_condition(condition_id)
+            if known:
+                return market
+
+            # Walk recent events (sorted by volume for relevance) page by page;
+            # every page fetched is indexed by condition ID as it's parsed
+            for page in range(CONDITION_SEARCH_PAGES):
+                events = await self.get_events(
+                    limit=CONDITION_SEARCH_PAGE_SIZE,
+                    offset=page * CONDITION_SEARCH_PAGE_SIZE,
+                )
+                _, market = _lookup_condition(condition_id)
+                if market:
                     logger.info(f"Found market in events: {market.question[:50]}...")
                     return market
+                if not events:
+                    break
+
+            # Remember the miss so repeat lookups (e.g. closed markets polled
+            # by the resolution loop) don't walk /events again; skipped when
+            # nothing came back, which may be a failed request
+            if page > 0 or events:
+                _condition_index[condition_id] = (time.monotonic(), None)
 
             logger.warning(f"Market {condition_id[:16]}... not found in events search")
             return None
@@ -350,9 +838,7 @@ class GammaMarketClient:
             Market or None if not found
         """
         try:
-            client = await self._get_client()
-
-            response = await client.get(f"{self.host}/markets/slug/{slug}")
+            response = await self._get(f"{self._markets_url}/slug/{slug}")
 
             if response.status_code == 404:
                 logger.warning(f"Market slug not found: {slug}")
@@ -360,7 +846,7 @@ class GammaMarketClient:
 
             response.raise_for_status()
 
-            data = response.json()
+            data = orjson.loads(response.content)
             return Market.from_api(data)
 
         except Exception as e:
@@ -380,21 +866,40 @@ class GammaMarketClient:
         """
         try:
             # Gamma API doesn't have direct search, fetch and filter
-            all_markets = await self.get_events(limit=100)
+            index = await self._get_search_index()
 
             query_lower = query.lower()
-            matching = [
-                m for m in all_markets
-                if query_lower in m.question.lower()
-                or (m.description and query_lower in m.description.lower())
-            ]
+            matching = (market for market, text in index if query_lower in text)
 
-            return matching[:limit]
+            # Stop scanning once enough matches are found
+            return list(islice(matching, limit))
 
         except Exception as e:
             logger.error(f"Search failed: {e}")
             return []
 
+    async def _get_search_index(self) -> List[tuple[Market, str]]:
+        """Get searchable markets with their question/description pre-lowercased.
+
+        Question and description are joined with a NUL separator, so each
+        query is one substring scan per market and can't match across them.
+
+        Returns:
+            List of (market, searchable_text) tuples
+        """
+        cached = self._cache_get(("search_index",), EVENTS_CACHE_TTL)
+        if cached is not None:
+            return cached
+
+        all_markets = await self.get_events(limit=100)
+        index = [
+            (m, f"{m.question}\0{m.description or ''}".lower())
+            for m in all_markets
+        ]
+        if index:
+            self._cache_set(("search_index",), index)
+        return index
+
     async def get_tags(self, limit: int = 100) -> List[Dict[str, Any]]:
         """
         Get available tags/categories.
@@ -402,16 +907,26 @@ class GammaMarketClient:
         Returns:
             List of tags with id and label
         """
-        try:
-            client = await self._get_client()
+        cache_key = ("tags", limit)
+        cached = self._cache_get(cache_key, TAGS_CACHE_TTL)
+        if cached is not None:
+            return list(cached)
 
-            response = await client.get(
-                f"{self.host}/tags",
+        try:
+            etag_entry = self._etags.get(cache_key)
+            response = await self._get(
+                self._tags_url,
                 params={"limit": limit},
+                headers={"If-None-Match": etag_entry[0]} if etag_entry else None,
             )
-            response.raise_for_status()
-
-            return response.json()
+            if response.status_code == 304 and etag_entry:
+                tags = etag_entry[1]
+            else:
+                response.raise_for_status()
+                tags = orjson.loads(response.content)
+                self._store_etag(cache_key, response, tags)
+            self._cache_set(cache_key, tags)
+            return list(tags)
 
         except Exception as e:
             logger.error(f"Failed to fetch tags: {e}")
@@ -452,23 +967,28 @@ class GammaMarketClient:
         Returns:
             Current price or None
         """
-        try:
-            client = await self._get_client()
+        cache_key = ("price", token_id)
+        cached = self._cache_get(cache_key, PRICE_CACHE_TTL)
+        if cached is not None:
+            return cached
 
-            response = await client.get(
-                f"{self.host}/markets",
+        try:
+            response = await self._get(
+                self._markets_url,
                 params={"clob_token_ids": token_id},
             )
             response.raise_for_status()
 
-            data = response.json()
+            data = orjson.loads(response.content)
             if data:
                 market = Market.from_api(data[0])
                 # Return YES price if this is YES token, otherwise NO
                 if market.yes_token_id == token_id:
-                    return market.yes_price
+                    price = market.yes_price
                 else:
-                    return market.no_price
+                    price = market.no_price
+                self._cache_set(cache_key, price)
+                return price
 
             return None
 
@@ -493,34 +1013,36 @@ class GammaMarketClient:
 
             # Fetch trader profile data from Polymarket API
             # Using the profiles endpoint which provides trader statistics
-            profile_url = f"https://polymarket.com/api/profile/{address.lower()}"
-            response = await client.get(profile_url)
+            address_lower = address.lower()
+            response = await client.get(f"{PROFILE_URL}/{address_lower}")
 
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
 
                 # Extract stats from profile response
-                positions_value = float(data.get("positionsValue", 0) or 0)
-                profit_loss = float(data.get("profitLoss", 0) or 0)
+                positions_value = _float_field(data, "positionsValue")
+                profit_loss = _float_field(data, "profitLoss")
 
                 return {
                     "address": address,
                     "total_volume": positions_value,
-                    "total_trades": int(data.get("tradesCount", 0) or 0),
+                    "total_trades": _int_field(data, "tradesCount"),
                     "pnl": profit_loss,
                     "win_rate": self._calculate_win_rate(data),
                     "positions_value": positions_value,
-                    "profit_loss_percent": float(data.get("profitLossPercent", 0) or 0),
+                    "profit_loss_percent": _float_field(data, "profitLossPercent"),
                     "username": data.get("username", ""),
                     "profile_image": data.get("profileImage", ""),
                 }
 
             # Fallback: Try the CLOB API activity endpoint
-            clob_url = f"https://clob.polymarket.com/activity?user={address.lower()}&limit=100"
-            clob_response = await client.get(clob_url)
+            clob_response = await client.get(
+                CLOB_ACTIVITY_URL,
+                params={"user": address_lower, "limit": 100},
+            )
 
             if clob_response.status_code == 200:
-                activities = clob_response.json()
+                activities = orjson.loads(clob_response.content)
                 return self._calculate_stats_from_activity(address, activities)
 
             # Return basic stats if no data available
@@ -539,8 +1061,8 @@ class GammaMarketClient:
     def _calculate_win_rate(self, profile_data: Dict[str, Any]) -> float:
         """Calculate win rate from profile data."""
         try:
-            winning_trades = int(profile_data.get("winningTrades", 0) or 0)
-            total_trades = int(profile_data.get("tradesCount", 0) or 0)
+            winning_trades = _int_field(profile_data, "winningTrades")
+            total_trades = _int_field(profile_data, "tradesCount")
 
             if total_trades == 0:
                 return 0.0
@@ -564,23 +1086,18 @@ class GammaMarketClient:
                 "win_rate": 0,
             }
 
-        total_volume = 0.0
         total_trades = len(activities)
-        profitable_trades = 0
-        total_pnl = 0.0
-
-        for activity in activities:
-            # Calculate volume from trade size and price
-            size = float(activity.get("size", 0) or 0)
-            price = float(activity.get("price", 0) or 0)
-            trade_value = size * price
-            total_volume += trade_value
-
-            # Track PnL if available
-            pnl = float(activity.get("pnl", 0) or 0)
-            total_pnl += pnl
-            if pnl > 0:
-                profitable_trades += 1
+
+        # Calculate volume from trade size and price
+        total_volume = sum(
+            _float_field(activity, "size") * _float_field(activity, "price")
+            for activity in activities
+        )
+
+        # Track PnL if available
+        pnls = [_float_field(activity, "pnl") for activity in activities]
+        total_pnl = sum(pnls)
+        profitable_trades = sum(1 for pnl in pnls if pnl > 0)
 
         win_rate = (profitable_trades / total_trades * 100) if total_trades > 0 else 0
 
@@ -619,9 +1136,8 @@ class GammaMarketClient:
             client = await self._get_client()
 
             # Official Polymarket leaderboard API
-            leaderboard_url = "https://data-api.polymarket.com/v1/leaderboard"
             response = await client.get(
-                leaderboard_url,
+                LEADERBOARD_URL,
                 params={
                     "category": category,
                     "timePeriod": time_period,
@@ -635,24 +1151,12 @@ class GammaMarketClient:
                 logger.warning(f"Leaderboard API returned {response.status_code}")
                 return []
 
-            data = response.json()
-            traders = []
+            data = orjson.loads(response.content)
 
             # API returns array of trader objects directly
-            for entry in data if isinstance(data, list) else []:
-                trader = {
-                    "address": entry.get("proxyWallet", ""),
-                    "name": entry.get("userName", "Anonymous"),
-                    "pnl": float(entry.get("pnl", 0) or 0),
-                    "volume": float(entry.get("vol", 0) or 0),
-                    "rank": int(entry.get("rank", 0) or 0),
-                    "profile_image": entry.get("profileImage", ""),
-                    "x_username": entry.get("xUsername", ""),
-                    "verified": entry.get("verifiedBadge", False),
-                }
-                traders.append(trader)
-
-            return traders
+            if not isinstance(data, list):
+                return []
+            return [_leaderboard_row(entry) for entry in data]
 
         except Exception as e:
             logger.error(f"Failed to fetch top traders: {e}")
@@ -671,28 +1175,17 @@ class GammaMarketClient:
         try:
             client = await self._get_client()
 
-            leaderboard_url = "https://data-api.polymarket.com/v1/leaderboard"
             response = await client.get(
-                leaderboard_url,
+                LEADERBOARD_URL,
                 params={"user": address.lower()},
             )
 
             if response.status_code != 200:
                 return None
 
-            data = response.json()
+            data = orjson.loads(response.content)
             if data and isinstance(data, list) and len(data) > 0:
-                entry = data[0]
-                return {
-                    "address": entry.get("proxyWallet", address),
-                    "name": entry.get("userName", "Anonymous"),
-                    "pnl": float(entry.get("pnl", 0) or 0),
-                    "volume": float(entry.get("vol", 0) or 0),
-                    "rank": int(entry.get("rank", 0) or 0),
-                    "profile_image": entry.get("profileImage", ""),
-                    "x_username": entry.get("xUsername", ""),
-                    "verified": entry.get("verifiedBadge", False),
-                }
+                return _leaderboard_row(data[0], address)
 
             return None
 
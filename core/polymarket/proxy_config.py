@@ -1,6 +1,8 @@
 """Proxy configuration for Polymarket CLOB client."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
+
 import httpx
 from config import settings
 
@@ -15,6 +17,31 @@ def get_proxy_url() -> str:
     return _proxy_url
 
 
+def _check_external_ip(client: httpx.Client) -> None:
+    """Log the external IP seen through the proxy."""
+    try:
+        test_resp = client.get("https://httpbin.org/ip")
+        if test_resp.status_code == 200:
+            ip_info = test_resp.json()
+            logger.info(f"✅ Proxy working - External IP: {ip_info.get('origin', 'unknown')}")
+        else:
+            logger.warning(f"⚠️ Proxy test returned status {test_resp.status_code}")
+    except Exception as test_err:
+        logger.warning(f"⚠️ Proxy test failed: {test_err}")
+
+
+def _check_clob_access(client: httpx.Client) -> None:
+    """Log whether Polymarket's CLOB is reachable through the proxy."""
+    try:
+        test_resp = client.get("https://clob.polymarket.com/time")
+        if test_resp.status_code == 200:
+            logger.info(f"✅ Polymarket CLOB accessible via proxy")
+        else:
+            logger.warning(f"⚠️ Polymarket CLOB test returned status {test_resp.status_code}")
+    except Exception as test_err:
+        logger.warning(f"⚠️ Polymarket CLOB test failed: {test_err}")
+
+
 def configure_clob_proxy() -> None:
     """
     Configure the py-clob-client to use a proxy if configured.
@@ -41,36 +68,27 @@ def configure_clob_proxy() -> None:
         # Import the helpers module from py-clob-client
         from py_clob_client.http_helpers import helpers
 
-        # Create a new httpx client with proxy support
+        # Create a new httpx client with proxy support; one retry on the
+        # transport keeps a transient proxy hiccup from failing startup
         proxy_client = httpx.Client(
-            http2=True,
-            proxy=proxy_url,
+            transport=httpx.HTTPTransport(http2=True, proxy=proxy_url, retries=1),
             timeout=30.0,
         )
 
         # Replace the global client used by py-clob-client
         helpers._http_client = proxy_client
 
-        # Test the proxy by making a simple request
-        try:
-            test_resp = proxy_client.get("https://httpbin.org/ip", timeout=10.0)
-            if test_resp.status_code == 200:
-                ip_info = test_resp.json()
-                logger.info(f"✅ Proxy working - External IP: {ip_info.get('origin', 'unknown')}")
-            else:
-                logger.warning(f"⚠️ Proxy test returned status {test_resp.status_code}")
-        except Exception as test_err:
-            logger.warning(f"⚠️ Proxy test failed: {test_err}")
-
-        # Also test against Polymarket directly
-        try:
-            test_resp = proxy_client.get("https://clob.polymarket.com/time", timeout=10.0)
-            if test_resp.status_code == 200:
-                logger.info(f"✅ Polymarket CLOB accessible via proxy")
-            else:
-                logger.warning(f"⚠️ Polymarket CLOB test returned status {test_resp.status_code}")
-        except Exception as test_err:
-            logger.warning(f"⚠️ Polymarket CLOB test failed: {test_err}")
+        # Run both proxy checks at once so startup waits one round trip, not two.
+        # They get a short-lived HTTP/1.1 client of their own, so no idle probe
+        # connection lingers next to the one py-clob-client keeps open
+        with httpx.Client(proxy=proxy_url, timeout=10.0) as probe_client:
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                checks = [
+                    pool.submit(_check_external_ip, probe_client),
+                    pool.submit(_check_clob_access, probe_client),
+                ]
+                for check in checks:
+                    check.result()
 
         logger.info("✅ CLOB client configured to use proxy")
 
@@ -1,6 +1,7 @@
 """Wallet generation using eth-account."""
 
 from eth_account import Account
+from eth_utils import to_canonical_address
 from typing import Tuple
 
 from web3 import Web3
@@ -10,6 +11,10 @@ from web3 import Web3
 SAFE_FACTORY = "0xaacfeea03eb1561c4e67d661e40682bd20e3541b"
 SAFE_INIT_CODE_HASH = "0x2bce2127ff07fb632d16c8347c4ebf501f4841168bed00d9e6ef715ddb6fcecf"
 
+# Fixed parts of the CREATE2 preimage, decoded once: 0xff ++ factory, and init_code_hash
+_CREATE2_PREFIX = b"\xff" + bytes.fromhex(SAFE_FACTORY[2:])
+_SAFE_INIT_CODE_HASH_BYTES = bytes.fromhex(SAFE_INIT_CODE_HASH[2:])
+
 
 class WalletGenerator:
     """Generate Ethereum/Polygon wallets."""
@@ -28,25 +33,19 @@ class WalletGenerator:
         Returns:
             Deterministic Safe wallet address
         """
-        # Normalize address
-        eoa_address = Web3.to_checksum_address(eoa_address)
+        # Raw 20 address bytes (validates the input; no checksum keccak needed)
+        address_bytes = to_canonical_address(eoa_address)
 
         # Salt = keccak256(abi.encode(eoa_address))
         # The address is left-padded to 32 bytes
-        address_bytes = bytes.fromhex(eoa_address[2:])  # Remove 0x prefix
-        padded_address = address_bytes.rjust(32, b'\x00')
+        padded_address = bytes(12) + address_bytes
         salt = Web3.keccak(padded_address)
 
         # CREATE2: keccak256(0xff ++ factory ++ salt ++ init_code_hash)[12:]
-        create2_input = (
-            b'\xff'
-            + bytes.fromhex(SAFE_FACTORY[2:])
-            + salt
-            + bytes.fromhex(SAFE_INIT_CODE_HASH[2:])
-        )
+        create2_input = _CREATE2_PREFIX + salt + _SAFE_INIT_CODE_HASH_BYTES
         full_hash = Web3.keccak(create2_input)
         # Take last 20 bytes (address = hash[12:])
-        return Web3.to_checksum_address(full_hash[12:].hex())
+        return Web3.to_checksum_address(full_hash[12:])
 
     @staticmethod
     def create_wallet() -> Tuple[str, str]:
@@ -39,6 +39,7 @@ class AlchemyWebhookManager:
         """Get or create HTTP session."""
         if self._session is None or self._session.closed:
             self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=30, connect=5),
                 headers={
                     "X-Alchemy-Token": self.auth_token,
                     "Content-Type": "application/json",
@@ -61,32 +62,7 @@ class AlchemyWebhookManager:
         Returns:
             True if successful
         """
-        if not addresses:
-            return True
-
-        try:
-            session = await self._get_session()
-
-            payload = {
-                "webhook_id": self.webhook_id,
-                "addresses_to_add": addresses,
-            }
-
-            async with session.patch(
-                f"{ALCHEMY_NOTIFY_API}/update-webhook-addresses",
-                json=payload,
-            ) as response:
-                if response.status == 200:
-                    logger.info(f"Added {len(addresses)} addresses to Alchemy webhook")
-                    return True
-                else:
-                    error = await response.text()
-                    logger.error(f"Failed to add addresses: {response.status} - {error}")
-                    return False
-
-        except Exception as e:
-            logger.error(f"Failed to add addresses to webhook: {e}")
-            return False
+        return await self._update_addresses(to_add=addresses, to_remove=[])
 
     async def remove_addresses(self, addresses: List[str]) -> bool:
         """
@@ -98,7 +74,20 @@ class AlchemyWebhookManager:
         Returns:
             True if successful
         """
-        if not addresses:
+        return await self._update_addresses(to_add=[], to_remove=addresses)
+
+    async def _update_addresses(self, to_add: List[str], to_remove: List[str]) -> bool:
+        """
+        Add and remove webhook addresses in a single request.
+
+        Args:
+            to_add: Wallet addresses to add
+            to_remove: Wallet addresses to remove
+
+        Returns:
+            True if successful
+        """
+        if not to_add and not to_remove:
             return True
 
         try:
@@ -106,7 +95,8 @@ class AlchemyWebhookManager:
 
             payload = {
                 "webhook_id": self.webhook_id,
-                "addresses_to_remove": addresses,
+                "addresses_to_add": to_add,
+                "addresses_to_remove": to_remove,
             }
 
             async with session.patch(
@@ -114,15 +104,17 @@ class AlchemyWebhookManager:
                 json=payload,
             ) as response:
                 if response.status == 200:
-                    logger.info(f"Removed {len(addresses)} addresses from Alchemy webhook")
+                    logger.info(
+                        f"Updated Alchemy webhook addresses: +{len(to_add)} -{len(to_remove)}"
+                    )
                     return True
                 else:
                     error = await response.text()
-                    logger.error(f"Failed to remove addresses: {response.status} - {error}")
+                    logger.error(f"Failed to update addresses: {response.status} - {error}")
                     return False
 
         except Exception as e:
-            logger.error(f"Failed to remove addresses from webhook: {e}")
+            logger.error(f"Failed to update webhook addresses: {e}")
             return False
 
     async def get_addresses(self) -> List[str]:
@@ -174,15 +166,8 @@ class AlchemyWebhookManager:
             to_add = list(desired - current)
             to_remove = list(current - desired)
 
-            success = True
-
-            if to_add:
-                if not await self.add_addresses(to_add):
-                    success = False
-
-            if to_remove:
-                if not await self.remove_addresses(to_remove):
-                    success = False
+            # One PATCH carries both sides of the diff
+            success = await self._update_addresses(to_add, to_remove)
 
             logger.info(
                 f"Synced webhook addresses: +{len(to_add)} -{len(to_remove)} "
@@ -26,6 +26,9 @@ from config.constants import USDC_ADDRESS, USDC_E_ADDRESS, USDC_DECIMALS
 
 logger = logging.getLogger(__name__)
 
+# Lowercased USDC token contracts, matched against every webhook activity
+_USDC_CONTRACTS = frozenset((USDC_ADDRESS.lower(), USDC_E_ADDRESS.lower()))
+
 
 class AlchemyWebhookHandler:
     """
@@ -54,6 +57,8 @@ class AlchemyWebhookHandler:
         """
         self.db = db
         self.signing_key = signing_key
+        # Keyed once; each verification copies it instead of re-keying
+        self._signature_hmac = hmac.new(signing_key.encode(), digestmod=hashlib.sha256)
         self.bot_send_message = bot_send_message
 
         # Track monitored addresses (lowercase)
@@ -93,11 +98,9 @@ class AlchemyWebhookHandler:
             logger.warning("No signing key configured, skipping verification")
             return True
 
-        expected = hmac.new(
-            self.signing_key.encode(),
-            body,
-            hashlib.sha256
-        ).hexdigest()
+        mac = self._signature_hmac.copy()
+        mac.update(body)
+        expected = mac.hexdigest()
 
         return hmac.compare_digest(expected, signature)
 
@@ -188,7 +191,7 @@ class AlchemyWebhookHandler:
             raw_contract = activity.get("rawContract", {})
             contract_address = raw_contract.get("address", "").lower()
 
-            if contract_address not in (USDC_ADDRESS.lower(), USDC_E_ADDRESS.lower()):
+            if contract_address not in _USDC_CONTRACTS:
                 return
 
             # Get transfer details
@@ -298,21 +301,43 @@ class AlchemyWebhookHandler:
                 wallet.encryption_salt,
             )
 
+            # Reuse stored API credentials so initialize() doesn't re-derive them
+            api_creds = None
+            if wallet.has_api_credentials:
+                try:
+                    api_creds = {
+                        "api_key": encryption.decrypt(wallet.api_key_encrypted, wallet.encryption_salt),
+                        "api_secret": encryption.decrypt(wallet.api_secret_encrypted, wallet.encryption_salt),
+                        "api_passphrase": encryption.decrypt(wallet.api_passphrase_encrypted, wallet.encryption_salt),
+                    }
+                except Exception as e:
+                    logger.warning(f"Failed to decrypt API credentials: {e}")
+
             # Create CLOB client
             client = PolymarketCLOB(
                 private_key=private_key,
                 funder_address=wallet.address,
+                api_creds=api_creds,
             )
 
-            # Initialize client (creates API credentials)
+            # Initialize client (derives API credentials if none were stored)
             await client.initialize()
 
+            wallet_repo = WalletRepository(self.db)
+            if api_creds is None and client.api_credentials:
+                creds = client.api_credentials
+                await wallet_repo.update_api_credentials(
+                    wallet.id,
+                    encryption.encrypt_with_salt(creds["api_key"], wallet.encryption_salt),
+                    encryption.encrypt_with_salt(creds["api_secret"], wallet.encryption_salt),
+                    encryption.encrypt_with_salt(creds["api_passphrase"], wallet.encryption_salt),
+                )
+
             # Set USDC allowance (unlimited approval via gasless relayer)
             success = await client.set_allowance()
 
             if success:
                 # Mark as approved in database
-                wallet_repo = WalletRepository(self.db)
                 await wallet_repo.update(
                     wallet.id,
                     usdc_approved=True,
@@ -2,10 +2,10 @@
 
 import asyncio
 import logging
-import json
 from typing import Optional, Callable, Dict, Any, Set, Coroutine
 from dataclasses import dataclass, field
 
+import orjson
 import websockets
 
 logger = logging.getLogger(__name__)
@@ -127,7 +127,8 @@ class WebSocketManager:
             }
 
         try:
-            await state.websocket.send(json.dumps(subscription_message))
+            # Compact JSON, sent as a text frame
+            await state.websocket.send(orjson.dumps(subscription_message).decode())
             logger.info(f"Subscribed to {len(asset_ids)} assets on {connection_name}")
             return True
         except Exception as e:
@@ -152,7 +153,7 @@ class WebSocketManager:
         }
 
         try:
-            await state.websocket.send(json.dumps(message))
+            await state.websocket.send(orjson.dumps(message).decode())
             logger.info(f"Unsubscribed from {len(asset_ids)} assets on {connection_name}")
             return True
         except Exception as e:
@@ -225,9 +226,9 @@ class WebSocketManager:
             async for message in websocket:
                 state.last_message_time = asyncio.get_event_loop().time()
                 try:
-                    data = json.loads(message)
+                    data = orjson.loads(message)
                     await handler(name, data)
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     logger.warning(f"Invalid JSON from {name}: {message[:100]}")
                 except Exception as e:
                     logger.error(f"Handler error for {name}: {e}")
@@ -2,7 +2,8 @@
 
 import asyncio
 import logging
-from typing import Dict, Any, Optional, Callable, Set
+import time
+from typing import Dict, Any, Optional, Callable, Set, Tuple
 
 from database.connection import Database
 from database.repositories import (
@@ -21,6 +22,11 @@ logger = logging.getLogger(__name__)
 # Polymarket WebSocket event types
 EVENT_PRICE_CHANGE = "price_change"
 EVENT_LAST_TRADE = "last_trade_price"
+EVENT_BOOK = "book"
+
+# Streamed best bid/ask older than this is not served; callers fall back to
+# the REST book (quiet markets may not send a price_change for a long time)
+TOP_OF_BOOK_MAX_AGE = 30.0
 
 
 class PriceSubscriber:
@@ -51,6 +57,7 @@ class PriceSubscriber:
         self._active_stop_losses: Dict[str, list] = {}  # token_id -> list of stop losses
         self._active_alerts: Dict[str, list] = {}  # token_id -> list of price alerts
         self._monitored_positions: Set[str] = set()  # token_ids with active positions
+        self._top_of_book: Dict[str, Tuple[float, Optional[float], Optional[float]]] = {}  # token_id -> (updated_at, best_bid, best_ask)
 
     async def start(self) -> None:
         """Start the price subscriber."""
@@ -71,11 +78,68 @@ class PriceSubscriber:
         data: Dict[str, Any],
     ) -> None:
         """Handle incoming market WebSocket messages."""
+        # Book snapshots arrive batched as a list of events
+        if isinstance(data, list):
+            for event in data:
+                if isinstance(event, dict):
+                    await self._handle_market_message(connection_name, event)
+            return
+
         event_type = data.get("event_type") or data.get("type")
 
-        if event_type in (EVENT_PRICE_CHANGE, EVENT_LAST_TRADE):
+        if event_type == EVENT_BOOK:
+            self._handle_book(data)
+        elif event_type in (EVENT_PRICE_CHANGE, EVENT_LAST_TRADE):
+            if event_type == EVENT_PRICE_CHANGE:
+                self._handle_best_prices(data)
             await self._handle_price_update(data)
 
+    def _handle_book(self, data: Dict[str, Any]) -> None:
+        """Record best bid/ask from a full order book snapshot."""
+        token_id = data.get("asset_id")
+        if not token_id:
+            return
+
+        try:
+            bids = [float(level["price"]) for level in data.get("bids") or []]
+            asks = [float(level["price"]) for level in data.get("asks") or []]
+        except (KeyError, TypeError, ValueError):
+            self._top_of_book.pop(token_id, None)
+            return
+
+        self._top_of_book[token_id] = (
+            time.monotonic(),
+            max(bids) if bids else None,
+            min(asks) if asks else None,
+        )
+
+    def _handle_best_prices(self, data: Dict[str, Any]) -> None:
+        """
+        Record best bid/ask carried on price_change events.
+
+        A change that doesn't carry both (including the legacy single-price
+        format) means the book moved in a way we can't see, so the token's
+        entry is dropped rather than left to be served as current.
+        """
+        changes = data.get("price_changes")
+        if changes is None:
+            changes = [data]
+
+        for change in changes:
+            token_id = change.get("asset_id")
+            if not token_id:
+                continue
+            if "best_bid" not in change or "best_ask" not in change:
+                self._top_of_book.pop(token_id, None)
+                continue
+            try:
+                best_bid = float(change["best_bid"]) if change["best_bid"] else None
+                best_ask = float(change["best_ask"]) if change["best_ask"] else None
+            except (TypeError, ValueError):
+                self._top_of_book.pop(token_id, None)
+                continue
+            self._top_of_book[token_id] = (time.monotonic(), best_bid, best_ask)
+
     async def _handle_price_update(self, data: Dict[str, Any]) -> None:
         """Process price update and check stop losses."""
         token_id = data.get("asset_id") or data.get("token_id")
@@ -508,3 +572,17 @@ class PriceSubscriber:
     def get_current_price(self, token_id: str) -> Optional[float]:
         """Get the current cached price for a token."""
         return self._token_prices.get(token_id)
+
+    def get_top_of_book(self, token_id: str) -> Optional[Tuple[Optional[float], Optional[float]]]:
+        """Get the streamed (best_bid, best_ask) for a token.
+
+        Returns None when the token isn't tracked, its entry is older than
+        TOP_OF_BOOK_MAX_AGE or the market feed is disconnected, in which case
+        callers should fall back to REST.
+        """
+        if not self.ws_manager.is_connected("polymarket_market"):
+            return None
+        entry = self._top_of_book.get(token_id)
+        if entry is None or time.monotonic() - entry[0] > TOP_OF_BOOK_MAX_AGE:
+            return None
+        return entry[1], entry[2]
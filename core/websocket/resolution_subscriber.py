@@ -7,7 +7,7 @@ from typing import Dict, Any, Set, Callable, Optional
 from datetime import datetime
 
 from database.connection import Database
-from core.polymarket import GammaMarketClient
+from core.polymarket import GammaMarketClient, Market
 
 logger = logging.getLogger(__name__)
 
@@ -104,12 +104,12 @@ class ResolutionSubscriber:
         # Check already-processed markets to avoid duplicate processing
         processed = await self._get_processed_markets()
 
-        for condition_id in list(self._monitored_markets):
-            if condition_id in processed:
-                continue
+        pending = [c for c in self._monitored_markets if c not in processed]
+        markets = await self.gamma_client.get_markets_by_condition_ids(pending)
 
+        for condition_id, market in zip(pending, markets):
             try:
-                resolution_data = await self._get_resolution_data(condition_id)
+                resolution_data = self._get_resolution_data(condition_id, market)
 
                 if resolution_data and resolution_data.get("resolved"):
                     winning_outcome = resolution_data.get("winning_outcome")
@@ -127,9 +127,10 @@ class ResolutionSubscriber:
             except Exception as e:
                 logger.error(f"Check resolution failed for {condition_id[:16]}...: {e}")
 
-    async def _get_resolution_data(
+    def _get_resolution_data(
         self,
         condition_id: str,
+        market: Optional[Market],
     ) -> Optional[Dict[str, Any]]:
         """
         Get resolution data for a market.
@@ -140,13 +141,12 @@ class ResolutionSubscriber:
 
         Args:
             condition_id: Market condition ID
+            market: Market fetched for condition_id, or None if not found
 
         Returns:
             Dict with resolved status and winning outcome
         """
         try:
-            market = await self.gamma_client.get_market_by_condition_id(condition_id)
-
             if not market:
                 return {"resolved": False}
 
@@ -6,6 +6,7 @@ from telegram.ext import Application
 from config import settings
 from database.connection import Database
 from core.wallet import KeyEncryption
+from core.polymarket.clob_client import set_book_state_provider
 from core.websocket.manager import WebSocketManager
 from core.websocket.price_subscriber import PriceSubscriber
 from core.websocket.copy_trade_subscriber import CopyTradeSubscriber
@@ -59,6 +60,9 @@ class WebSocketService:
         )
         await self.price_subscriber.start()
 
+        # Serve best bid/ask lookups from the streamed books where available
+        set_book_state_provider(self.price_subscriber.get_top_of_book)
+
         # Note: Deposit detection is now handled by Alchemy webhooks
         # See run_all.py -> run_webhook_server() for the new implementation
         # This saves millions of Alchemy compute units per day
@@ -159,6 +163,8 @@ class WebSocketService:
         """Stop all WebSocket connections."""
         logger.info("Stopping WebSocket service...")
 
+        set_book_state_provider(None)
+
         if self.resolution_subscriber:
             await self.resolution_subscriber.stop()
 
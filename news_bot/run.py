@@ -21,7 +21,7 @@ load_dotenv()
 from config import settings
 from news_bot.settings import news_settings
 from database.connection import Database
-from core.polymarket.gamma_client import GammaMarketClient
+from core.polymarket.gamma_client import GammaMarketClient, close_gamma_client
 from news_bot.database.repositories.posted_market_repo import PostedMarketRepository
 from news_bot.services.market_monitor import MarketMonitorService
 from news_bot.services.web_researcher import WebResearcherService
@@ -273,7 +273,7 @@ class PolynewsBot:
             self.job_manager.stop()
 
         if self.gamma_client:
-            await self.gamma_client.close()
+            await close_gamma_client()
 
         if self.web_researcher:
             await self.web_researcher.close()
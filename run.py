@@ -27,6 +27,8 @@ logger = logging.getLogger(__name__)
 
 async def main():
     """Initialize and run the bot."""
+    from core.polymarket.gamma_client import close_gamma_client
+
     logger.info("Starting PolyBot...")
 
     # Configure proxy for CLOB client (if set)
@@ -64,6 +66,7 @@ async def main():
             await app.updater.stop()
             await app.stop()
             await app.shutdown()
+            await close_gamma_client()
 
 
 if __name__ == "__main__":
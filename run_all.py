@@ -240,7 +240,6 @@ async def run_polynews(db: "Database"):
             pass
         finally:
             job_manager.stop()
-            await gamma_client.close()
             await web_researcher.close()
             logger.info("Polynews Bot stopped")
 
@@ -507,6 +506,7 @@ async def main():
 
     # Initialize shared database connection pool
     from config import settings
+    from core.polymarket.gamma_client import close_gamma_client
     from database.connection import Database
 
     db = Database(settings.database_url)
@@ -541,8 +541,9 @@ async def main():
     except Exception as e:
         logger.error(f"Runner error: {e}")
     finally:
-        # Close shared database pool
+        # Close shared database pool and Gamma HTTP client
         await db.close()
+        await close_gamma_client()
         logger.info("All bots stopped")
 
 
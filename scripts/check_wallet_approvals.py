@@ -9,6 +9,8 @@ Usage:
 
 import asyncio
 import sys
+from eth_abi import decode as abi_decode, encode as abi_encode
+from eth_utils import function_signature_to_4byte_selector
 from web3 import Web3
 
 # Contract addresses
@@ -30,6 +32,14 @@ CTF_OPERATORS = [
     ("Neg Risk Adapter", NEG_RISK_ADAPTER_ADDRESS),
 ]
 
+# Multicall3 aggregator (same address on every EVM chain)
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+# Approval reads are batched through Multicall3, so their calldata is built by hand
+ALLOWANCE_SELECTOR = function_signature_to_4byte_selector("allowance(address,address)")
+IS_APPROVED_FOR_ALL_SELECTOR = function_signature_to_4byte_selector("isApprovedForAll(address,address)")
+AGGREGATE_SELECTOR = function_signature_to_4byte_selector("aggregate((address,bytes)[])")
+
 # ABIs
 ERC20_ABI = [
     {
@@ -51,20 +61,6 @@ ERC20_ABI = [
     },
 ]
 
-ERC1155_ABI = [
-    {
-        "constant": True,
-        "inputs": [
-            {"name": "_owner", "type": "address"},
-            {"name": "_operator", "type": "address"}
-        ],
-        "name": "isApprovedForAll",
-        "outputs": [{"name": "", "type": "bool"}],
-        "type": "function"
-    },
-]
-
-
 import time
 
 def rate_limited_call(fn, max_retries=3, delay=2):
@@ -99,24 +95,36 @@ def check_usdc_balance(w3: Web3, usdc_contract, address: str) -> float:
     return balance / 10**6
 
 
-def check_usdc_allowance(w3: Web3, usdc_contract, owner: str, spender: str) -> int:
-    """Check USDC allowance."""
-    return rate_limited_call(
-        lambda: usdc_contract.functions.allowance(
-            Web3.to_checksum_address(owner),
-            Web3.to_checksum_address(spender),
-        ).call()
+def _encode_address(address: str) -> bytes:
+    """ABI-encode an address as a 32-byte word."""
+    return int(address, 16).to_bytes(32, "big")
+
+
+def check_approvals(w3: Web3, owner: str) -> tuple[list[int], list[bool]]:
+    """
+    Check every USDC allowance and CTF operator approval in one RPC.
+
+    Returns:
+        (allowance per USDC_SPENDERS entry, approval per CTF_OPERATORS entry)
+    """
+    owner_word = _encode_address(owner)
+    calls = [
+        (USDC_ADDRESS, ALLOWANCE_SELECTOR + owner_word + _encode_address(spender))
+        for _, spender in USDC_SPENDERS
+    ] + [
+        (CTF_ADDRESS, IS_APPROVED_FOR_ALL_SELECTOR + owner_word + _encode_address(operator))
+        for _, operator in CTF_OPERATORS
+    ]
+    data = AGGREGATE_SELECTOR + abi_encode(["(address,bytes)[]"], [calls])
+    raw = rate_limited_call(
+        lambda: w3.eth.call({"to": MULTICALL3_ADDRESS, "data": data})
     )
+    _, results = abi_decode(["uint256", "bytes[]"], raw)
 
-
-def check_ctf_approval(w3: Web3, ctf_contract, owner: str, operator: str) -> bool:
-    """Check CTF operator approval."""
-    return rate_limited_call(
-        lambda: ctf_contract.functions.isApprovedForAll(
-            Web3.to_checksum_address(owner),
-            Web3.to_checksum_address(operator),
-        ).call()
-    )
+    values = [int.from_bytes(result[-32:], "big") for result in results]
+    allowances = values[:len(USDC_SPENDERS)]
+    approvals = [value != 0 for value in values[len(USDC_SPENDERS):]]
+    return allowances, approvals
 
 
 def main():
@@ -150,10 +158,6 @@ def main():
         address=Web3.to_checksum_address(USDC_ADDRESS),
         abi=ERC20_ABI,
     )
-    ctf_contract = w3.eth.contract(
-        address=Web3.to_checksum_address(CTF_ADDRESS),
-        abi=ERC1155_ABI,
-    )
 
     # Check Safe deployment
     is_deployed = check_safe_deployed(w3, wallet_address)
@@ -164,12 +168,14 @@ def main():
     print(f"USDC Balance: ${balance:.2f}")
     print()
 
+    # All allowances and operator approvals come back from one multicall
+    allowances, approvals = check_approvals(w3, wallet_address)
+
     # Check USDC allowances
     print("USDC Allowances:")
     print("-" * 40)
     all_usdc_approved = True
-    for name, spender in USDC_SPENDERS:
-        allowance = check_usdc_allowance(w3, usdc_contract, wallet_address, spender)
+    for (name, _), allowance in zip(USDC_SPENDERS, allowances):
         if allowance > 0:
             if allowance >= 2**200:  # Near unlimited
                 status = "✅ UNLIMITED"
@@ -185,8 +191,7 @@ def main():
     print("CTF Operator Approvals:")
     print("-" * 40)
     all_ctf_approved = True
-    for name, operator in CTF_OPERATORS:
-        is_approved = check_ctf_approval(w3, ctf_contract, wallet_address, operator)
+    for (name, _), is_approved in zip(CTF_OPERATORS, approvals):
         if is_approved:
             status = "✅ APPROVED"
         else:
@@ -198,8 +203,8 @@ def main():
     # Summary
     print("=" * 60)
     total_approvals = len(USDC_SPENDERS) + len(CTF_OPERATORS)
-    passed = sum(1 for _, s in USDC_SPENDERS if check_usdc_allowance(w3, usdc_contract, wallet_address, s) > 0)
-    passed += sum(1 for _, o in CTF_OPERATORS if check_ctf_approval(w3, ctf_contract, wallet_address, o))
+    passed = sum(1 for allowance in allowances if allowance > 0)
+    passed += sum(1 for is_approved in approvals if is_approved)
 
     if all_usdc_approved and all_ctf_approved:
         print("✅ ALL 6 APPROVALS SET - Ready for trading")
@@ -1,5 +1,6 @@
 """Operator commission service for platform fee collection."""
 
+import asyncio
 import logging
 from typing import Dict, Any, Optional
 from dataclasses import dataclass
@@ -11,7 +12,9 @@ from eth_account import Account
 from database.connection import Database
 from database.models import Wallet
 from config import settings
-from config.constants import USDC_E_ADDRESS, USDC_DECIMALS
+from config.constants import USDC_E_ADDRESS, USDC_SCALE
+from core.blockchain.nonce import get_nonce_tracker
+from core.blockchain.withdrawals import to_checksum
 
 logger = logging.getLogger(__name__)
 
@@ -76,6 +79,9 @@ class CommissionService:
         else:
             self.gas_sponsor_account = None
 
+        # Nonces are shared with every other service signing with these keys
+        self._nonces = get_nonce_tracker()
+
     def is_enabled(self) -> bool:
         """Check if commission collection is enabled."""
         return bool(self.operator_wallet and self.commission_rate > 0)
@@ -153,7 +159,7 @@ class CommissionService:
             sender_address = sender_account.address
 
             # Convert to token units (6 decimals for USDC)
-            amount_units = int(amount * (10 ** USDC_DECIMALS))
+            amount_units = int(amount * USDC_SCALE)
 
             # Check sender balance
             balance = self.usdc_contract.functions.balanceOf(sender_address).call()
@@ -178,11 +184,10 @@ class CommissionService:
                     logger.warning("Insufficient POL for commission transfer gas")
 
             # Build transfer transaction
-            nonce = self.w3.eth.get_transaction_count(sender_address)
             gas_price = self.w3.eth.gas_price
 
             tx_data = self.usdc_contract.functions.transfer(
-                Web3.to_checksum_address(self.operator_wallet),
+                to_checksum(self.operator_wallet),
                 amount_units,
             )
 
@@ -192,18 +197,16 @@ class CommissionService:
             except Exception:
                 estimated_gas = 100000  # Default gas for ERC20 transfer
 
-            # Build transaction
+            # Build transaction (nonce is reserved when signing)
             tx = tx_data.build_transaction({
                 "from": sender_address,
-                "nonce": nonce,
                 "gas": int(estimated_gas * 1.2),
                 "gasPrice": gas_price,
                 "chainId": settings.chain_id,
             })
 
             # Sign and send
-            signed_tx = self.w3.eth.account.sign_transaction(tx, from_private_key)
-            tx_hash = self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
+            tx_hash = await self._nonces.sign_and_send(self.w3, sender_account, tx)
 
             logger.info(
                 f"Commission transfer sent: ${amount:.4f} USDC "
@@ -229,24 +232,22 @@ class CommissionService:
             return TransferResult(success=False, error="No gas sponsor configured")
 
         try:
-            nonce = self.w3.eth.get_transaction_count(self.gas_sponsor_account.address)
             gas_price = self.w3.eth.gas_price
 
             tx = {
                 "from": self.gas_sponsor_account.address,
-                "to": Web3.to_checksum_address(to_address),
+                "to": to_checksum(to_address),
                 "value": self.w3.to_wei(amount_pol, "ether"),
-                "nonce": nonce,
                 "gas": 21000,
                 "gasPrice": gas_price,
                 "chainId": settings.chain_id,
             }
 
-            signed_tx = self.w3.eth.account.sign_transaction(tx, self.gas_sponsor_account.key)
-            tx_hash = self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
+            tx_hash = await self._nonces.sign_and_send(
+                self.w3, self.gas_sponsor_account, tx
+            )
 
             # Wait briefly for gas to arrive
-            import asyncio
             await asyncio.sleep(3)
 
             return TransferResult(success=True, tx_hash=tx_hash.hex())
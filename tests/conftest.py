@@ -0,0 +1,7 @@
+"""Shared pytest configuration."""
+
+import os
+
+# config.settings requires these at import time; tests never use real values
+os.environ.setdefault("TELEGRAM_BOT_TOKEN", "test-token")
+os.environ.setdefault("MASTER_ENCRYPTION_KEY", "test-master-key")
@@ -0,0 +1,36 @@
+"""Tests for mapping CLOB order errors to user-facing messages."""
+
+from core.polymarket.clob_client import (
+    _LIMIT_ORDER_ERRORS,
+    _MARKET_ORDER_ERRORS,
+    _friendly_order_error,
+)
+
+ALLOWANCE_MESSAGE = "USDC allowance not set. Please approve USDC for trading."
+
+
+def test_combined_balance_allowance_error_maps_to_allowance():
+    error = Exception("PolyApiException: not enough balance / allowance")
+
+    assert _friendly_order_error(error, _MARKET_ORDER_ERRORS) == ALLOWANCE_MESSAGE
+    assert _friendly_order_error(error, _LIMIT_ORDER_ERRORS) == ALLOWANCE_MESSAGE
+
+
+def test_balance_error_maps_to_insufficient_balance():
+    error = Exception("Insufficient funds for order")
+
+    assert _friendly_order_error(error, _MARKET_ORDER_ERRORS) == "Insufficient balance"
+
+
+def test_no_orderbook_takes_priority_for_market_orders():
+    error = Exception("No orderbook exists for the requested token id")
+
+    message = _friendly_order_error(error, _MARKET_ORDER_ERRORS)
+
+    assert message.startswith("This market has no active orders")
+
+
+def test_unknown_error_is_passed_through():
+    error = Exception("something unexpected")
+
+    assert _friendly_order_error(error, _LIMIT_ORDER_ERRORS) == "something unexpected"
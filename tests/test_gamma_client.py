@@ -0,0 +1,97 @@
+"""Tests for the Gamma API client."""
+
+import time
+
+import httpx
+import pytest
+
+from core.polymarket import gamma_client
+from core.polymarket.gamma_client import GammaMarketClient, close_gamma_client
+
+
+async def test_closing_one_client_keeps_shared_pool_open():
+    client = GammaMarketClient()
+    shared = await client._get_client()
+
+    await GammaMarketClient().close()
+
+    assert not shared.is_closed
+    assert await client._get_client() is shared
+
+    await close_gamma_client()
+    assert shared.is_closed
+    assert gamma_client._shared_client is None
+
+
+@pytest.fixture
+def gamma_transport(monkeypatch):
+    """Route the shared Gamma client through a mock transport."""
+    responses = []
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return responses.pop(0)
+
+    monkeypatch.setattr(gamma_client, "GAMMA_RETRY_BACKOFF", 0.0)
+    monkeypatch.setattr(gamma_client, "_consecutive_failures", 0)
+    monkeypatch.setattr(gamma_client, "_circuit_open_until", 0.0)
+    monkeypatch.setattr(
+        gamma_client,
+        "_shared_client",
+        httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    return responses, requests
+
+
+async def test_streamed_events_request_retries_5xx(gamma_transport):
+    responses, requests = gamma_transport
+    responses += [httpx.Response(503), httpx.Response(200, json=[])]
+
+    assert await GammaMarketClient().get_events() == []
+    assert len(requests) == 2
+    assert gamma_client._consecutive_failures == 0
+
+
+async def test_streamed_events_request_respects_open_circuit(gamma_transport, monkeypatch):
+    _, requests = gamma_transport
+    monkeypatch.setattr(gamma_client, "_circuit_open_until", time.monotonic() + 60)
+
+    assert await GammaMarketClient().get_events() == []
+    assert requests == []
+
+
+async def test_get_tags_returns_copy_of_cached_list(gamma_transport):
+    responses, requests = gamma_transport
+    responses.append(httpx.Response(200, json=[{"id": 1, "label": "Politics"}]))
+    client = GammaMarketClient()
+
+    (await client.get_tags()).clear()
+    (await client.get_tags()).append({"id": 2})
+
+    assert await client.get_tags() == [{"id": 1, "label": "Politics"}]
+    assert len(requests) == 1
+
+
+async def test_condition_id_miss_is_remembered(gamma_transport, monkeypatch):
+    responses, requests = gamma_transport
+    monkeypatch.setattr(gamma_client, "_condition_index", {})
+    monkeypatch.setattr(gamma_client, "CONDITION_SEARCH_PAGES", 2)
+    event = {
+        "id": "1",
+        "title": "Other",
+        "markets": [{"conditionId": "0xother", "clobTokenIds": '["1", "2"]'}],
+    }
+    responses += [
+        httpx.Response(200, json=[]),  # /markets batch
+        httpx.Response(200, json=[event]),  # /events page 1
+        httpx.Response(200, json=[]),  # /events page 2
+        httpx.Response(200, json=[]),  # /markets batch, second lookup
+    ]
+
+    assert await GammaMarketClient().get_market_by_condition_id("0xmissing") is None
+    assert await GammaMarketClient().get_market_by_condition_id("0xmissing") is None
+
+    paths = [request.url.path for request in requests]
+    assert paths.count("/events") == 2
+    assert paths.count("/markets") == 2
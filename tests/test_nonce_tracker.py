@@ -0,0 +1,79 @@
+"""Tests for the shared local nonce tracker."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.blockchain.nonce import NonceTracker
+
+ADDRESS = "0x19E7E376E7C213B7E7e7e46cc70A5dD086DAff2A"
+
+
+def make_w3(pending: int = 7) -> MagicMock:
+    w3 = MagicMock()
+    w3.eth.get_transaction_count.return_value = pending
+    return w3
+
+
+async def test_reserves_sequential_nonces_from_one_fetch():
+    w3 = make_w3()
+    tracker = NonceTracker()
+
+    assert [await tracker.reserve(w3, ADDRESS) for _ in range(3)] == [7, 8, 9]
+    w3.eth.get_transaction_count.assert_called_once_with(ADDRESS, "pending")
+
+
+async def test_refetches_after_ttl():
+    w3 = make_w3()
+    tracker = NonceTracker(ttl=0.0)
+
+    await tracker.reserve(w3, ADDRESS)
+    w3.eth.get_transaction_count.return_value = 12
+
+    assert await tracker.reserve(w3, ADDRESS) == 12
+
+
+async def test_drops_least_recently_used_sender():
+    w3 = make_w3()
+    tracker = NonceTracker(max_entries=2)
+
+    for address in ("0x" + "01" * 20, "0x" + "02" * 20, "0x" + "03" * 20):
+        await tracker.reserve(w3, address)
+
+    assert list(tracker._entries) == ["0x" + "02" * 20, "0x" + "03" * 20]
+
+
+async def test_release_rolls_back_last_reservation():
+    w3 = make_w3()
+    tracker = NonceTracker()
+
+    nonce = await tracker.reserve(w3, ADDRESS)
+    tracker.release(ADDRESS, nonce)
+
+    assert await tracker.reserve(w3, ADDRESS) == nonce
+    w3.eth.get_transaction_count.assert_called_once()
+
+
+async def test_release_after_later_reservation_refetches():
+    w3 = make_w3()
+    tracker = NonceTracker()
+
+    nonce = await tracker.reserve(w3, ADDRESS)
+    await tracker.reserve(w3, ADDRESS)
+    tracker.release(ADDRESS, nonce)
+    await tracker.reserve(w3, ADDRESS)
+
+    assert w3.eth.get_transaction_count.call_count == 2
+
+
+async def test_failed_broadcast_evicts_nonce():
+    w3 = make_w3()
+    w3.eth.send_raw_transaction.side_effect = ValueError("nonce too low")
+    account = MagicMock(address=ADDRESS)
+    tracker = NonceTracker()
+
+    with pytest.raises(ValueError):
+        await tracker.sign_and_send(w3, account, {"gas": 21000})
+
+    account.sign_transaction.assert_called_once_with({"gas": 21000, "nonce": 7})
+    assert ADDRESS not in tracker._entries
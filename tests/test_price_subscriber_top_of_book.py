@@ -0,0 +1,65 @@
+"""Tests for the streamed best bid/ask served by PriceSubscriber."""
+
+from unittest.mock import MagicMock
+
+from core.websocket import price_subscriber
+from core.websocket.price_subscriber import PriceSubscriber
+
+TOKEN = "123"
+
+
+def make_subscriber() -> PriceSubscriber:
+    ws_manager = MagicMock()
+    ws_manager.is_connected.return_value = True
+    return PriceSubscriber(ws_manager, MagicMock(), MagicMock(), "wss://example")
+
+
+def test_price_change_with_best_prices_is_served():
+    subscriber = make_subscriber()
+    subscriber._handle_best_prices({
+        "price_changes": [{"asset_id": TOKEN, "best_bid": "0.41", "best_ask": "0.43"}],
+    })
+
+    assert subscriber.get_top_of_book(TOKEN) == (0.41, 0.43)
+
+
+def test_change_without_best_prices_invalidates_snapshot():
+    subscriber = make_subscriber()
+    subscriber._handle_book({
+        "asset_id": TOKEN,
+        "bids": [{"price": "0.40"}],
+        "asks": [{"price": "0.45"}],
+    })
+
+    subscriber._handle_best_prices({
+        "price_changes": [{"asset_id": TOKEN, "price": "0.42", "side": "BUY"}],
+    })
+
+    assert subscriber.get_top_of_book(TOKEN) is None
+
+
+def test_legacy_price_change_invalidates_snapshot():
+    subscriber = make_subscriber()
+    subscriber._handle_book({
+        "asset_id": TOKEN,
+        "bids": [{"price": "0.40"}],
+        "asks": [{"price": "0.45"}],
+    })
+
+    subscriber._handle_best_prices({"asset_id": TOKEN, "price": "0.42"})
+
+    assert subscriber.get_top_of_book(TOKEN) is None
+
+
+def test_old_snapshot_is_not_served(monkeypatch):
+    subscriber = make_subscriber()
+    subscriber._handle_book({
+        "asset_id": TOKEN,
+        "bids": [{"price": "0.40"}],
+        "asks": [{"price": "0.45"}],
+    })
+    assert subscriber.get_top_of_book(TOKEN) == (0.40, 0.45)
+
+    monkeypatch.setattr(price_subscriber, "TOP_OF_BOOK_MAX_AGE", -1.0)
+
+    assert subscriber.get_top_of_book(TOKEN) is None
@@ -0,0 +1,24 @@
+"""Tests for referral QR rendering on trade cards."""
+
+import math
+from itertools import groupby
+
+from core.images.trade_card import _render_qr
+
+BACKGROUND = (20, 20, 28)
+LINK = "https://t.me/PolyBot?start=ref_ABC123XY"
+
+
+def test_qr_fills_slot_without_resampling():
+    img = _render_qr(LINK, 90, BACKGROUND)
+
+    assert img.width == img.height
+    assert abs(img.width - 90) <= 10
+    assert {color for _, color in img.getcolors()} == {BACKGROUND, (255, 255, 255)}
+
+    # Every module spans the same whole number of pixels (no fractional upscale)
+    runs = []
+    for y in range(img.height):
+        row = [img.getpixel((x, y)) for x in range(img.width)]
+        runs.extend(len(list(group)) for _, group in groupby(row))
+    assert math.gcd(*runs) > 1